@@ -0,0 +1,83 @@
+from functools import lru_cache
+
+import numpy as np
+from sympy import diff, lambdify
+from sympy.parsing.sympy_parser import parse_expr, standard_transformations, convert_xor, \
+    implicit_multiplication_application
+
+TRANSFORMATIONS = standard_transformations + (convert_xor, implicit_multiplication_application)
+
+# Максимальное число скомпилированных выражений в кэше
+CACHE_SIZE = 128
+
+
+def _vectorized(fn, x):
+    """Вызов скомпилированной функции; константа растягивается до формы массива x."""
+    result = fn(x)
+    if np.ndim(x) and np.ndim(result) == 0:
+        return np.full(np.shape(x), result, dtype=float)
+    return result
+
+
+class Expression:
+    """
+    Произвольная функция одной переменной, заданная строкой, например 'exp(-x) - x^2'.
+    Выражение разбирается и дифференцируется символьно один раз,
+    f, f' и f'' компилируются в функции NumPy.
+    """
+
+    def __init__(self, text: str):
+        expr = parse_expr(text, transformations=TRANSFORMATIONS)
+        symbols = expr.free_symbols
+        if len(symbols) != 1:
+            raise ValueError("Выражение должно зависеть ровно от одной переменной.")
+        x, = symbols
+
+        self.text = text
+        self.symbol = x
+        self.expr = expr
+        self.derivative_expr = diff(expr, x)
+        self.derivative2_expr = diff(self.derivative_expr, x)
+
+        self._f = lambdify(x, expr, 'numpy')
+        self._df = lambdify(x, self.derivative_expr, 'numpy')
+        self._d2f = lambdify(x, self.derivative2_expr, 'numpy')
+        # Совместное вычисление с общими подвыражениями
+        self._f_df = lambdify(x, (expr, self.derivative_expr), 'numpy', cse=True)
+        self._f_df_d2f = lambdify(x, (expr, self.derivative_expr, self.derivative2_expr), 'numpy', cse=True)
+
+    def __call__(self, x):
+        """Вычисление значения функции f(x)."""
+        return _vectorized(self._f, x)
+
+    def derivative(self, x):
+        """Вычисление значения производной f'(x)."""
+        return _vectorized(self._df, x)
+
+    def derivative2(self, x):
+        """Вычисление значения второй производной f''(x)."""
+        return _vectorized(self._d2f, x)
+
+    def evaluate(self, x, order: int = 2) -> tuple:
+        """
+        Вычисление f(x) и производных до порядка order (не выше 2) одним вызовом.
+        :return: Кортеж (f(x), f'(x)) при order=1 или (f(x), f'(x), f''(x)) при order=2.
+        """
+        fn = self._f_df if order == 1 else self._f_df_d2f
+        values = fn(x)
+        if np.ndim(x):
+            return tuple(np.full(np.shape(x), v, dtype=float) if np.ndim(v) == 0 else v for v in values)
+        return tuple(values)
+
+    def __str__(self) -> str:
+        return self.text
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_expression(text: str) -> Expression:
+    """
+    Компиляция выражения с кэшированием по тексту.
+    Повторный запрос того же выражения не требует разбора и дифференцирования;
+    при переполнении кэша вытесняются давно не использованные выражения.
+    """
+    return Expression(text)
@@ -1,8 +1,12 @@
+from typing import NamedTuple
+
 import matplotlib.pyplot as plt
 import numpy as np
 from prettytable import PrettyTable
 import matplotlib
 
+from expression import Expression, compile_expression
+
 # matplotlib.use("TkAgg")
 
 
@@ -10,13 +14,139 @@ def midpoint_of_interval(a: float, b: float) -> float:
     return (a + b) / 2.0
 
 
-class Func:
+def _cardano_roots(a: float, b: float, c: float, d: float) -> np.ndarray | None:
+    """
+    Корни кубического уравнения по формуле Кардано (тригонометрическая форма для трёх вещественных корней).
+    :return: Массив из трёх корней или None, если формула плохо обусловлена.
+    """
+    p, q, r = b / a, c / a, d / a
+    # Подстановка x = t - p/3 приводит уравнение к виду t^3 + P*t + Q = 0
+    shift = p / 3
+    P = q - p * p / 3
+    Q = 2 * p ** 3 / 27 - p * q / 3 + r
+    discriminant = (Q / 2) ** 2 + (P / 3) ** 3
+
+    scale = max(abs(p), abs(q) ** 0.5, abs(r) ** (1 / 3), 1.0)
+    if not np.isfinite(discriminant) or abs(discriminant) <= 1e-12 * scale ** 6:
+        # Кратные или близкие корни: формула теряет точность
+        return None
+
+    if discriminant < 0:
+        # Три различных вещественных корня
+        m = 2 * np.sqrt(-P / 3)
+        theta = np.arccos(np.clip(3 * Q / (P * m), -1.0, 1.0)) / 3
+        t = m * np.cos(theta - 2 * np.pi * np.arange(3) / 3)
+        return np.sort(t - shift).astype(complex)
+
+    # Один вещественный корень и пара комплексно-сопряжённых
+    sqrt_discriminant = np.sqrt(discriminant)
+    u = np.cbrt(-Q / 2 + sqrt_discriminant)
+    v = np.cbrt(-Q / 2 - sqrt_discriminant)
+    real = u + v
+    imag = np.sqrt(3) / 2 * (u - v)
+    return np.array([real - shift, complex(-real / 2 - shift, imag), complex(-real / 2 - shift, -imag)])
+
+
+def _companion_roots(*coefficients: float) -> np.ndarray:
+    """Корни многочлена как собственные значения сопровождающей матрицы."""
+    coefficients = np.asarray(coefficients, dtype=float)
+    n = len(coefficients) - 1
+    if n < 1:
+        return np.empty(0, dtype=complex)
+    companion = np.eye(n, k=-1)
+    companion[0, :] = -coefficients[1:] / coefficients[0]
+    roots = np.linalg.eigvals(companion).astype(complex)
+    return roots[np.lexsort((roots.imag, roots.real))]
+
+
+class Polynomial:
+    """
+    Многочлен произвольной степени p(x) = c[0]x^n + c[1]x^(n-1) + ... + c[n].
+    Коэффициенты первой и второй производных вычисляются один раз при создании,
+    значения считаются по схеме Горнера для чисел и массивов NumPy.
+    """
+
+    def __init__(self, coefficients):
+        coefficients = np.asarray(coefficients, dtype=float)
+        if coefficients.ndim != 1 or coefficients.size < 2:
+            raise ValueError("Многочлен должен иметь степень не ниже первой.")
+        if coefficients[0] == 0:
+            raise ValueError("Старший коэффициент многочлена не может быть равен нулю.")
+        if not np.all(np.isfinite(coefficients)):
+            raise ValueError("Коэффициенты не могут быть бесконечными.")
+
+        n = coefficients.size - 1
+        self.coefficients = coefficients
+        self.derivative_coefficients = coefficients[:-1] * np.arange(n, 0, -1)
+        self.derivative2_coefficients = self.derivative_coefficients[:-1] * np.arange(n - 1, 0, -1)
+
+        # Списки Python: в цикле Горнера для скалярного x они быстрее элементов массива
+        self._c = coefficients.tolist()
+        self._dc = self.derivative_coefficients.tolist()
+        self._d2c = self.derivative2_coefficients.tolist()
+
+    @property
+    def degree(self) -> int:
+        return len(self._c) - 1
+
+    @staticmethod
+    def _horner(coefficients: list[float], x):
+        result = coefficients[0] if coefficients else 0.0
+        for c in coefficients[1:]:
+            result = result * x + c
+        return result
+
+    def __call__(self, x):
+        """Вычисление значения многочлена p(x)."""
+        return self._horner(self._c, x)
+
+    def derivative(self, x):
+        """Вычисление значения производной p'(x)."""
+        return self._horner(self._dc, x)
+
+    def derivative2(self, x):
+        """Вычисление значения второй производной p''(x)."""
+        return self._horner(self._d2c, x)
+
+    def evaluate(self, x, order: int = 2) -> tuple:
+        """
+        Вычисление p(x) и производных до порядка order (не выше 2) за один проход схемы Горнера.
+        :return: Кортеж (p(x), p'(x)) при order=1 или (p(x), p'(x), p''(x)) при order=2.
+        """
+        p = self._c[0]
+        dp = d2p = 0.0
+        for c in self._c[1:]:
+            if order > 1:
+                d2p = d2p * x + dp
+            dp = dp * x + p
+            p = p * x + c
+        if order == 1:
+            return p, dp
+        return p, dp, 2 * d2p
+
+    def __str__(self) -> str:
+        n = self.degree
+        result = ""
+        for k, c in enumerate(self._c):
+            power = n - k
+            if c == 0:
+                continue
+            sign = "-" if c < 0 else "+"
+            term = "" if abs(c) == 1 and power > 0 else f"{abs(c):g}"
+            if power >= 1:
+                term += "x" if power == 1 else f"x^{{{power}}}"
+            result += (sign if not result and sign == "-" else f" {sign} " if result else "") + term
+        return result
+
+
+class Func(Polynomial):
     def __init__(self, a: float, b: float, c: float, d: float):
         self.a = a
         self.b = b
         self.c = c
         self.d = d
         self.check()
+        super().__init__([a, b, c, d])
 
     def check(self):
         # Проверка, что a не равно 0
@@ -32,91 +162,525 @@ class Func:
 
     def __call__(self, x: float) -> float:
         """Вычисление значения функции f(x) = ax^3 + bx^2 + cx + d."""
-        return (self.a * pow(x, 3)) + (self.b * pow(x, 2)) + (self.c * x) + self.d
+        return ((self.a * x + self.b) * x + self.c) * x + self.d
 
     def derivative(self, x: float) -> float:
         """Вычисление значения производной f'(x) = 3ax^2 + 2bx + c."""
-        return (3 * self.a * pow(x, 2)) + (2 * self.b * x) + self.c
+        return (3 * self.a * x + 2 * self.b) * x + self.c
 
     def derivative2(self, x: float) -> float:
         """Вычисление значения производной f''(x) = 6ax + 2b."""
         return (6 * self.a * x) + (2 * self.b)
 
 
-class Solver:
-    def __init__(self, func: Func, precision: float = 0.01) -> None:
+# Поля записей итераций для каждого метода: (имя поля, заголовок таблицы)
+TRACE_COLUMNS = {
+    'bisection': [('iteration', 'Iteration'), ('a', 'a'), ('b', 'b'), ('midpoint', 'midpoint'),
+                  ('f_mid', 'F(mid)'), ('precision', 'precision')],
+    'newton': [('iteration', 'Iteration'), ('x', 'x'), ('f_x', 'F(x)'), ('df_x', "F'(x)"),
+               ('precision', 'precision')],
+    'secant': [('iteration', 'Iteration'), ('a', 'a'), ('b', 'b'), ('x', 'x'), ('f_x', 'F(x)'),
+               ('precision', 'precision')],
+    'brent': [('iteration', 'Iteration'), ('b', 'b'), ('c', 'c'), ('f_b', 'F(b)'), ('precision', 'precision')],
+    'halley': [('iteration', 'Iteration'), ('x', 'x'), ('f_x', 'F(x)'), ('df_x', "F'(x)"), ('d2f_x', "F''(x)"),
+               ('precision', 'precision')],
+}
+
+METHOD_TITLES = {
+    'bisection': 'Вычисление методом деления отрезка пополам',
+    'newton': 'Вычисление методом Ньютона',
+    'secant': 'Вычисление методом секущих (Иллинойс)',
+    'brent': 'Вычисление методом Брента',
+    'halley': 'Вычисление методом Галлея',
+}
+
+
+def trace_dtype(method: str, columns: dict | None = None) -> np.dtype:
+    """
+    Тип структурированного массива для хранения итераций метода.
+    :param columns: Таблица полей методов; по умолчанию TRACE_COLUMNS.
+    """
+    return np.dtype([(name, np.int64 if name == 'iteration' else np.float64)
+                     for name, _ in (TRACE_COLUMNS if columns is None else columns)[method]])
+
+
+def _critical_points(polynomial: Polynomial) -> list[float]:
+    """Вещественные корни производной многочлена в порядке возрастания."""
+    derivative = polynomial.derivative_coefficients
+    if derivative.size == 1:
+        return []
+    if derivative.size == 2:
+        return [float(-derivative[1] / derivative[0])]
+    if derivative.size > 3:
+        roots = _companion_roots(*derivative)
+        real = np.abs(roots.imag) <= 1e-9 * np.maximum(np.abs(roots.real), 1.0)
+        return sorted(roots.real[real].tolist())
+
+    a, b, c = derivative.tolist()
+    discriminant = b * b - 4 * a * c
+    if discriminant < 0:
+        return []
+    if discriminant == 0:
+        return [-b / (2 * a)]
+    # Устойчивая к сокращению форма корней квадратного уравнения
+    q = -(b + np.copysign(np.sqrt(discriminant), b)) / 2
+    return sorted([q / a, c / q]) if q != 0 else [0.0]
+
+
+class IterativeMethod:
+    """
+    Общая часть решателей: вывод сообщений, подсчёт вычислений функции
+    и прогон генераторов итераций с сохранением записей в структурированный массив.
+    Поля записей и заголовки методов задаются в trace_columns и method_titles подкласса.
+    """
+
+    trace_columns: dict = {}
+    method_titles: dict = {}
+
+    def __init__(self, func, precision: float = 0.01, verbose: bool = True, trace: bool = True) -> None:
+        """
+        :param func: Решаемое уравнение или система.
+        :param precision: Точность вычислений.
+        :param verbose: Выводить ли сообщения и таблицу итераций.
+        :param trace: Сохранять ли итерации в структурированный массив self.trace.
+        """
         self.func = func
         self.precision = precision
-
-    def bisection_method(self, a: float, b: float, max_iterations=1000) -> float:
-        print(f'Вычисление методом деления отрезка пополам')
-        if self.func(a) == 0:
-            print(f'a = {a} - корень уравнения')
-            return a
-        elif self.func(b) == 0:
-            print(f'b = {b} - корень уравнения')
-            return b
-
-        if self.func(a) * self.func(b) >= 0:
-            print("Функция должна менять знак на концах интервала [a, b].")
-            return 0
+        self.verbose = verbose
+        self.trace_enabled = trace
+        self.trace: np.ndarray | None = None
+        self.trace_method: str | None = None
+        self.converged = False  # Признак успеха последнего запущенного метода
+        self.evaluations = {'f': 0, "f'": 0, "f''": 0}
+
+    def _log(self, message: str) -> None:
+        if self.verbose:
+            print(message)
+
+    def _reset_evaluations(self) -> None:
+        self.evaluations = {'f': 0, "f'": 0, "f''": 0}
+
+    def _print_evaluations(self) -> None:
+        self._log("Число вычислений: " + ", ".join(f"{k}: {v}" for k, v in self.evaluations.items()))
+
+    def trace_table(self) -> PrettyTable:
+        """Построение таблицы итераций последнего запущенного метода."""
+        if self.trace is None:
+            raise ValueError("Итерации не сохранялись: создайте решатель с trace=True.")
+        t = PrettyTable([header for _, header in self.trace_columns[self.trace_method]])
+        for record in self.trace.tolist():
+            t.add_row(list(record))
+        return t
+
+    def _run(self, method: str, steps, max_iterations: int, spent: dict | None = None):
+        """
+        Прогон генератора итераций: сохранение записей в предвыделенный массив и вывод результата.
+        Генератор возвращает тройку (корень, сообщение, признак успеха);
+        число вычислений выводится только при успехе.
+        :param spent: Вычисления, сделанные до запуска генератора (например, предыдущим методом);
+        прибавляются к self.evaluations перед выводом.
+        :return: Корень, возвращённый генератором.
+        """
+        self._log(self.method_titles[method])
+        trace = (np.empty(max_iterations + 1, dtype=trace_dtype(method, self.trace_columns))
+                 if self.trace_enabled else None)
+        n = 0
+        while True:
+            try:
+                record = next(steps)
+            except StopIteration as stop:
+                root, message, success = stop.value
+                break
+            if trace is not None:
+                trace[n] = record
+                n += 1
+
+        if spent is not None:
+            self.evaluations = {k: v + spent.get(k, 0) for k, v in self.evaluations.items()}
+        self.trace = trace[:n] if trace is not None else None
+        self.trace_method = method
+        self.converged = success
+        if self.verbose and self.trace is not None and n:
+            print(self.trace_table())
+        self._log(message)
+        if success:
+            self._print_evaluations()
+            self._log('')
+        return root
+
+
+class Solver(IterativeMethod):
+    trace_columns = TRACE_COLUMNS
+    method_titles = METHOD_TITLES
+
+    def __init__(self, func: Polynomial | Expression | str, precision: float = 0.01, verbose: bool = True, trace: bool = True) -> None:
+        """
+        :param func: Решаемое уравнение: Func, Polynomial произвольной степени
+        или строка с выражением, например 'exp(-x) - x^2'.
+        :param precision: Точность вычислений.
+        :param verbose: Выводить ли сообщения и таблицу итераций.
+        :param trace: Сохранять ли итерации в структурированный массив self.trace.
+        """
+        if isinstance(func, str):
+            func = compile_expression(func)
+        super().__init__(func, precision, verbose, trace)
+
+    def _f(self, x: float) -> float:
+        self.evaluations['f'] += 1
+        return self.func(x)
+
+    def _df(self, x: float) -> float:
+        self.evaluations["f'"] += 1
+        return self.func.derivative(x)
+
+    def _d2f(self, x: float) -> float:
+        self.evaluations["f''"] += 1
+        return self.func.derivative2(x)
+
+    def _f_df(self, x: float) -> tuple[float, float]:
+        """Значение функции и производной; для многочленов - за один проход схемы Горнера."""
+        self.evaluations['f'] += 1
+        self.evaluations["f'"] += 1
+        return self.func.evaluate(x, 1)
+
+    def _f_df_d2f(self, x: float) -> tuple[float, float, float]:
+        self.evaluations['f'] += 1
+        self.evaluations["f'"] += 1
+        self.evaluations["f''"] += 1
+        return self.func.evaluate(x, 2)
+
+    def _require_polynomial(self) -> None:
+        if not isinstance(self.func, Polynomial):
+            raise TypeError("Метод применим только к многочленам.")
+
+    def bisection_steps(self, a: float, b: float, max_iterations=1000):
+        """
+        Итерации метода деления отрезка пополам.
+        :return: Генератор записей (iteration, a, b, midpoint, F(mid), precision);
+        по завершении возвращает тройку (корень, сообщение, признак успеха).
+        """
+        self._reset_evaluations()
+        f_a = self._f(a)
+        if f_a == 0:
+            return a, f'a = {a} - корень уравнения', True
+        f_b = self._f(b)
+        if f_b == 0:
+            return b, f'b = {b} - корень уравнения', True
+
+        if f_a * f_b >= 0:
+            return 0, "Функция должна менять знак на концах интервала [a, b].", False
 
         counter = 0
-        _root = 0
-        t = PrettyTable(['Iteration', 'a', 'b', 'midpoint', 'F(mid)', 'precision'])
         while True:
             precision = (b - a) / 2.0
             midpoint = midpoint_of_interval(a, b)
-            f_mid = self.func(midpoint)
+            f_mid = self._f(midpoint)
 
-            t.add_row([counter, a, b, midpoint, f_mid, precision])
+            yield counter, a, b, midpoint, f_mid, precision
 
             if f_mid == 0 or precision <= self.precision:
-                _root = midpoint
-                break
+                return midpoint, f'Корень уравнения равен = {midpoint}', True
 
-            if self.func(a) * f_mid < 0: # Определяем, в какой половине функции есть корень
+            if f_a * f_mid < 0: # Определяем, в какой половине функции есть корень
                 b = midpoint
             else:
-                a = midpoint
+                a, f_a = midpoint, f_mid
 
             counter += 1
             if counter > max_iterations:
-                print(f'Достигнут лимит ({max_iterations}) итераций')
-                break
-
-        print(t)
-        print(f'Корень уравнения равен = {_root}\n')
-        return _root
-
-    def newton_method(self, initial_guess: float, max_iterations: int = 1000) -> float:
-        print("Вычисление методом Ньютона")
+                return 0, f'Достигнут лимит ({max_iterations}) итераций', False
+
+    def newton_steps(self, initial_guess: float, max_iterations: int = 1000):
+        """
+        Итерации метода Ньютона.
+        :return: Генератор записей (iteration, x, F(x), F'(x), precision);
+        по завершении возвращает тройку (корень, сообщение, признак успеха).
+        """
+        self._reset_evaluations()
         x = initial_guess
         counter = 0
-        t = PrettyTable(['Iteration', 'x', 'F(x)', "F'(x)", 'precision'])
 
         while counter < max_iterations:
-            f_x = self.func(x)
-            f_prime_x = self.func.derivative(x)
+            f_x, f_prime_x = self._f_df(x)
 
             if f_prime_x == 0.0:
-                print(t)
-                print("Производная равна нулю; метод Ньютона не применим.")
-                return 0
+                return 0, "Производная равна нулю; метод Ньютона не применим.", False
 
             precision = abs(f_x / f_prime_x)
-            t.add_row([counter, x, f_x, f_prime_x, precision])
+            yield counter, x, f_x, f_prime_x, precision
 
             if abs(f_x) < self.precision and precision <= self.precision:
-                print(t)
-                print(f'Корень уравнения равен = {x}\n')
-                return x  # Если достигли нужной точности, возвращаем корень
+                return x, f'Корень уравнения равен = {x}', True  # Если достигли нужной точности, возвращаем корень
 
             x = x - f_x / f_prime_x
             counter += 1
 
-        print(t)
-        print("Метод Ньютона не сошелся за указанное число итераций.")
+        return None, "Метод Ньютона не сошелся за указанное число итераций.", False
+
+    def secant_steps(self, a: float, b: float, max_iterations: int = 1000):
+        """
+        Итерации метода секущих с сохранением интервала (модификация Иллинойс метода хорд).
+        Если одна граница интервала не меняется два шага подряд, значение функции на ней делится пополам.
+        :return: Генератор записей (iteration, a, b, x, F(x), precision);
+        по завершении возвращает тройку (корень, сообщение, признак успеха).
+        """
+        self._reset_evaluations()
+        f_a = self._f(a)
+        if f_a == 0:
+            return a, f'a = {a} - корень уравнения', True
+        f_b = self._f(b)
+        if f_b == 0:
+            return b, f'b = {b} - корень уравнения', True
+
+        if f_a * f_b >= 0:
+            return 0, "Функция должна менять знак на концах интервала [a, b].", False
+
+        counter = 0
+        x_prev = a
+        while True:
+            x = b - f_b * (b - a) / (f_b - f_a)
+            f_x = self._f(x)
+            precision = abs(x - x_prev)
+
+            yield counter, a, b, x, f_x, precision
+
+            if f_x == 0 or precision <= self.precision:
+                return x, f'Корень уравнения равен = {x}', True
+
+            if f_x * f_b < 0:
+                a, f_a = b, f_b
+            else:
+                f_a /= 2  # Граница a сохраняется: уменьшаем её вес
+            b, f_b = x, f_x
+            x_prev = x
+
+            counter += 1
+            if counter > max_iterations:
+                return x, f'Достигнут лимит ({max_iterations}) итераций', False
+
+    def brent_steps(self, a: float, b: float, max_iterations: int = 1000):
+        """
+        Итерации метода Брента: обратная квадратичная интерполяция и секущие
+        с гарантированной сходимостью за счёт шагов деления пополам.
+        :return: Генератор записей (iteration, b, c, F(b), precision);
+        по завершении возвращает тройку (корень, сообщение, признак успеха).
+        """
+        self._reset_evaluations()
+        f_a = self._f(a)
+        if f_a == 0:
+            return a, f'a = {a} - корень уравнения', True
+        f_b = self._f(b)
+        if f_b == 0:
+            return b, f'b = {b} - корень уравнения', True
+
+        if f_a * f_b >= 0:
+            return 0, "Функция должна менять знак на концах интервала [a, b].", False
+
+        c, f_c = a, f_a
+        d = e = b - a
+        counter = 0
+        while True:
+            if f_b * f_c > 0:
+                c, f_c = a, f_a
+                d = e = b - a
+            if abs(f_c) < abs(f_b):
+                # b - лучшее приближение, c - противоположная граница интервала
+                a, b, c = b, c, b
+                f_a, f_b, f_c = f_b, f_c, f_b
+
+            tol = 2 * np.finfo(float).eps * abs(b) + self.precision
+            m = (c - b) / 2
+            yield counter, b, c, f_b, abs(m)
+
+            if f_b == 0 or abs(m) <= tol:
+                return b, f'Корень уравнения равен = {b}', True
+
+            if abs(e) >= tol and abs(f_a) > abs(f_b):
+                s = f_b / f_a
+                if a == c:
+                    # Метод секущих
+                    p = 2 * m * s
+                    q = 1 - s
+                else:
+                    # Обратная квадратичная интерполяция
+                    q = f_a / f_c
+                    r = f_b / f_c
+                    p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                    q = (q - 1) * (r - 1) * (s - 1)
+                if p > 0:
+                    q = -q
+                else:
+                    p = -p
+                if 2 * p < min(3 * m * q - abs(tol * q), abs(e * q)):
+                    e, d = d, p / q
+                else:
+                    d = e = m
+            else:
+                d = e = m
+
+            a, f_a = b, f_b
+            b += d if abs(d) > tol else np.copysign(tol, m)
+            f_b = self._f(b)
+
+            counter += 1
+            if counter > max_iterations:
+                return b, f'Достигнут лимит ({max_iterations}) итераций', False
+
+    def halley_steps(self, initial_guess: float, max_iterations: int = 1000):
+        """
+        Итерации метода Галлея: x = x - 2f(x)f'(x) / (2f'(x)^2 - f(x)f''(x)), кубическая сходимость.
+        :return: Генератор записей (iteration, x, F(x), F'(x), F''(x), precision);
+        по завершении возвращает тройку (корень, сообщение, признак успеха).
+        """
+        self._reset_evaluations()
+        x = initial_guess
+        counter = 0
+
+        while counter < max_iterations:
+            f_x, f_prime_x, f_prime2_x = self._f_df_d2f(x)
+
+            denominator = 2 * f_prime_x * f_prime_x - f_x * f_prime2_x
+            if denominator == 0.0:
+                return None, "Знаменатель равен нулю; метод Галлея не применим.", False
+
+            step = 2 * f_x * f_prime_x / denominator
+            precision = abs(step)
+            yield counter, x, f_x, f_prime_x, f_prime2_x, precision
+
+            if abs(f_x) < self.precision and precision <= self.precision:
+                return x, f'Корень уравнения равен = {x}', True
+
+            x = x - step
+            counter += 1
+
+        return None, "Метод Галлея не сошелся за указанное число итераций.", False
+
+    def bisection_method(self, a: float, b: float, max_iterations=1000) -> float:
+        return self._run('bisection', self.bisection_steps(a, b, max_iterations), max_iterations)
+
+    def newton_method(self, initial_guess: float, max_iterations: int = 1000) -> float:
+        return self._run('newton', self.newton_steps(initial_guess, max_iterations), max_iterations)
+
+    def secant_method(self, a: float, b: float, max_iterations: int = 1000) -> float:
+        return self._run('secant', self.secant_steps(a, b, max_iterations), max_iterations)
+
+    def brent_method(self, a: float, b: float, max_iterations: int = 1000) -> float:
+        return self._run('brent', self.brent_steps(a, b, max_iterations), max_iterations)
+
+    def halley_method(self, initial_guess: float, max_iterations: int = 1000) -> float:
+        return self._run('halley', self.halley_steps(initial_guess, max_iterations), max_iterations)
+
+    def solve(self, a: float, b: float, method: str = 'auto', max_iterations: int = 1000) -> float:
+        """
+        Нахождение корня на интервале [a, b] выбранным методом.
+        :param method: 'bisection', 'secant', 'brent', 'newton', 'halley' или 'auto'.
+        В режиме 'auto' используется метод Брента: он гарантированно сходится на отрезке со сменой
+        знака и тратит одно вычисление f на шаг, поэтому обычно дешевле методов Ньютона и Галлея,
+        которым на шаг нужны ещё f' и f''. Если f не меняет знак на концах отрезка, выполняется
+        метод Ньютона из середины отрезка; число вычислений обоих методов выводится одной суммой.
+        """
+        bracketed = {
+            'bisection': self.bisection_method,
+            'secant': self.secant_method,
+            'brent': self.brent_method,
+        }
+        open_methods = {
+            'newton': self.newton_method,
+            'halley': self.halley_method,
+        }
+        if method in bracketed:
+            return bracketed[method](a, b, max_iterations)
+        if method in open_methods:
+            return open_methods[method](midpoint_of_interval(a, b), max_iterations)
+        if method != 'auto':
+            raise ValueError(f"Неизвестный метод '{method}'.")
+
+        root = self.brent_method(a, b, max_iterations)
+        if self.converged:
+            return root
+        return self._run('newton', self.newton_steps(midpoint_of_interval(a, b), max_iterations),
+                         max_iterations, self.evaluations)
+
+    def all_roots(self, polish_steps: int = 2) -> np.ndarray:
+        """
+        Нахождение всех (вещественных и комплексных) корней уравнения без начального интервала.
+        Используется формула Кардано, при плохой обусловленности - собственные значения
+        сопровождающей матрицы. Каждый корень уточняется несколькими шагами метода Ньютона.
+        :param polish_steps: Число уточняющих шагов метода Ньютона.
+        :return: Массив комплексных корней (для кубического уравнения - трёх).
+        """
+        self._require_polynomial()
+        self._log("Вычисление всех корней уравнения")
+        coefficients = self.func.coefficients
+        roots = _cardano_roots(*coefficients) if self.func.degree == 3 else None
+        if roots is None:
+            roots = _companion_roots(*coefficients)
+
+        for i, x in enumerate(roots):
+            for _ in range(polish_steps):
+                f_x, f_prime_x = self.func.evaluate(x, 1)
+                if f_x == 0 or f_prime_x == 0:
+                    break
+                x_new = x - f_x / f_prime_x
+                # Принимаем шаг, только если он уменьшает невязку
+                if abs(self.func(x_new)) >= abs(f_x):
+                    break
+                x = x_new
+            roots[i] = x
+
+        # Устраняем вычислительный мусор в мнимой части вещественных корней
+        roots.imag[np.abs(roots.imag) <= 1e-12 * np.maximum(np.abs(roots.real), 1.0)] = 0
+
+        if self.verbose:
+            t = PrettyTable(['№', 'x', 'F(x)'])
+            for i, x in enumerate(roots):
+                t.add_row([i + 1, x, abs(self.func(x))])
+            print(t)
+        return roots
+
+    def root_bound(self) -> float:
+        """Граница Коши: все корни уравнения лежат в круге |x| < R."""
+        self._require_polynomial()
+        coefficients = self.func.coefficients
+        return float(1 + np.max(np.abs(coefficients[1:])) / abs(coefficients[0]))
+
+    def critical_points(self) -> list[float]:
+        """Вещественные корни производной f'(x) в порядке возрастания."""
+        self._require_polynomial()
+        return _critical_points(self.func)
+
+    def isolate_roots(self) -> list[tuple[float, float]]:
+        """
+        Автоматическое отделение вещественных корней.
+        Отрезок [-R, R] разбивается критическими точками f на участки монотонности,
+        на каждом из которых не больше одного корня. Значение в критической точке, не превышающее
+        погрешности схемы Горнера, считается нулём: это кратный корень, а не два простых рядом.
+        :return: Список интервалов [a, b], каждый из которых содержит ровно один корень.
+        """
+        bound = self.root_bound()
+        points = np.array([-bound] + [x for x in self.critical_points() if -bound < x < bound] + [bound])
+        values = self.func(points)
+        # Оценка ошибки округления схемы Горнера: 2 n eps sum |c_i| |x|^i
+        rounding = (2 * self.func.degree * np.finfo(float).eps
+                    * Polynomial._horner(np.abs(self.func.coefficients).tolist(), np.abs(points)))
+        values[1:-1][np.abs(values[1:-1]) <= rounding[1:-1]] = 0
+
+        intervals = []
+        for i in np.flatnonzero(values == 0):
+            # Кратный корень в критической точке: знак не меняется
+            intervals.append((float(points[i]), float(points[i])))
+        # Интервалы, оканчивающиеся в кратном корне, имеют нулевое произведение и пропускаются
+        for i in np.flatnonzero(values[:-1] * values[1:] < 0):
+            intervals.append((float(points[i]), float(points[i + 1])))
+        return sorted(intervals)
+
+    def real_roots(self, max_iterations: int = 1000) -> list[float]:
+        """
+        Нахождение всех вещественных корней без участия пользователя:
+        каждый интервал из isolate_roots уточняется методом бисекции.
+        Вырожденный интервал [p, p] - кратный корень в критической точке p, он возвращается как есть.
+        """
+        return [a if a == b else self.bisection_method(a, b, max_iterations) for a, b in self.isolate_roots()]
 
     def plot_function(self) -> None:
         # Создаем массив x с диапазоном, например, от -10 до 10
@@ -124,7 +688,7 @@ class Solver:
         y = self.func(x)
 
         # Построение графика функции
-        plt.plot(x, y, label=f'$f(x) = {self.func.a}x^3 + {self.func.b}x^2 + {self.func.c}x + {self.func.d}$')
+        plt.plot(x, y, label=f'$f(x) = {self.func}$')
         plt.axhline(0, color='black', linewidth=0.5)  # Ось X
         plt.axvline(0, color='black', linewidth=0.5)  # Ось Y
 
@@ -157,3 +721,280 @@ class Solver:
         plt.legend()
         plt.grid(True)
         plt.show()
+
+
+class BatchResult(NamedTuple):
+    roots: np.ndarray
+    iterations: np.ndarray
+    converged: np.ndarray
+
+
+def _horner(coefficients: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Вычисление ax^3 + bx^2 + cx + d построчно по схеме Горнера."""
+    a, b, c, d = coefficients.T
+    return ((a * x + b) * x + c) * x + d
+
+
+def _horner_derivative(coefficients: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Вычисление 3ax^2 + 2bx + c построчно по схеме Горнера."""
+    a, b, c, _ = coefficients.T
+    return (3 * a * x + 2 * b) * x + c
+
+
+class BatchSolver:
+    """
+    Решение сразу m кубических уравнений, заданных массивом коэффициентов формы (m, 4).
+    Каждая строка [a, b, c, d] соответствует f(x) = ax^3 + bx^2 + cx + d.
+    Строки, которые сошлись, исключаются из дальнейших итераций.
+    """
+
+    def __init__(self, coefficients, precision: float = 0.01) -> None:
+        coefficients = np.asarray(coefficients, dtype=float)
+        if coefficients.ndim != 2 or coefficients.shape[1] != 4:
+            raise ValueError("Массив коэффициентов должен иметь форму (m, 4).")
+        if np.any(coefficients[:, 0] == 0):
+            raise ValueError("Коэффициент 'a' не может быть равен нулю для кубического уравнения.")
+        if not np.all(np.isfinite(coefficients)):
+            raise ValueError("Коэффициенты не могут быть бесконечными.")
+        self.coefficients = coefficients
+        self.precision = precision
+
+    def __len__(self) -> int:
+        return self.coefficients.shape[0]
+
+    def bisection_method(self, a, b, max_iterations: int = 1000) -> BatchResult:
+        """
+        Метод деления отрезка пополам для всех строк одновременно.
+        :param a: Левые границы интервалов (скаляр или массив длины m).
+        :param b: Правые границы интервалов (скаляр или массив длины m).
+        :param max_iterations: Максимальное число итераций.
+        :return: Корни, число итераций и признаки сходимости для каждой строки.
+        """
+        m = len(self)
+        a = np.broadcast_to(np.asarray(a, dtype=float), (m,)).copy()
+        b = np.broadcast_to(np.asarray(b, dtype=float), (m,)).copy()
+
+        roots = np.full(m, np.nan)
+        iterations = np.zeros(m, dtype=np.int64)
+        converged = np.zeros(m, dtype=bool)
+
+        f_a = _horner(self.coefficients, a)
+        f_b = _horner(self.coefficients, b)
+
+        # Корень на границе интервала
+        at_a = f_a == 0
+        at_b = ~at_a & (f_b == 0)
+        roots[at_a], roots[at_b] = a[at_a], b[at_b]
+        converged[at_a | at_b] = True
+
+        # Функция должна менять знак на концах интервала [a, b]
+        active = np.flatnonzero(f_a * f_b < 0)
+        coefficients = self.coefficients[active]
+        a, b, f_a = a[active], b[active], f_a[active]
+
+        counter = 0
+        while active.size:
+            precision = (b - a) / 2.0
+            midpoint = midpoint_of_interval(a, b)
+            f_mid = _horner(coefficients, midpoint)
+
+            done = (f_mid == 0) | (precision <= self.precision)
+            finished = active[done]
+            roots[finished] = midpoint[done]
+            iterations[finished] = counter
+            converged[finished] = True
+
+            keep = ~done
+            active, coefficients = active[keep], coefficients[keep]
+            a, b, f_a = a[keep], b[keep], f_a[keep]
+            midpoint, f_mid = midpoint[keep], f_mid[keep]
+
+            # Определяем, в какой половине функции есть корень
+            left = f_a * f_mid < 0
+            b = np.where(left, midpoint, b)
+            a = np.where(left, a, midpoint)
+            f_a = np.where(left, f_a, f_mid)
+
+            counter += 1
+            if counter > max_iterations:
+                roots[active] = midpoint
+                iterations[active] = counter
+                break
+
+        return BatchResult(roots, iterations, converged)
+
+    def newton_method(self, initial_guess, max_iterations: int = 1000) -> BatchResult:
+        """
+        Метод Ньютона для всех строк одновременно.
+        :param initial_guess: Начальные приближения (скаляр или массив длины m).
+        :param max_iterations: Максимальное число итераций.
+        :return: Корни, число итераций и признаки сходимости для каждой строки.
+        """
+        m = len(self)
+        x = np.broadcast_to(np.asarray(initial_guess, dtype=float), (m,)).copy()
+
+        roots = np.full(m, np.nan)
+        iterations = np.full(m, max_iterations, dtype=np.int64)
+        converged = np.zeros(m, dtype=bool)
+
+        active = np.arange(m)
+        coefficients = self.coefficients
+        counter = 0
+        while active.size and counter < max_iterations:
+            f_x = _horner(coefficients, x)
+            f_prime_x = _horner_derivative(coefficients, x)
+
+            # Производная равна нулю: для этих строк метод Ньютона не применим
+            degenerate = f_prime_x == 0.0
+            with np.errstate(divide='ignore', invalid='ignore'):
+                step = f_x / f_prime_x
+            precision = np.abs(step)
+
+            done = ~degenerate & (np.abs(f_x) < self.precision) & (precision <= self.precision)
+            finished = active[done]
+            roots[finished] = x[done]
+            iterations[finished] = counter
+            converged[finished] = True
+            iterations[active[degenerate]] = counter
+
+            keep = ~(done | degenerate)
+            active, coefficients = active[keep], coefficients[keep]
+            x = x[keep] - step[keep]
+            counter += 1
+
+        roots[active] = x
+        return BatchResult(roots, iterations, converged)
+
+
+def invert(func: Polynomial | Expression, targets, initial_guess: float = 0.0, precision: float = 0.01,
+           max_iterations: int = 100, bracket: tuple[float, float] | None = None,
+           anchors: int = 1024) -> BatchResult:
+    """
+    Решение уравнений f(x) = y сразу для массива значений y (обращение функции).
+    1. Для равномерной выборки из не более чем anchors значений y корни находятся по очереди
+       методом Ньютона, каждый раз начиная с решения для предыдущего значения (продолжение по параметру).
+    2. Начальные приближения для всех y получаются линейной интерполяцией между соседними решениями.
+    3. Метод Ньютона выполняется векторно для всех y, сошедшиеся строки исключаются.
+    В критических точках (f'(x) = 0) вместо шага Ньютона делается небольшое смещение.
+    4. Для несошедшихся строк выполняется векторный метод бисекции на отрезке bracket
+       (для многочленов по умолчанию - участок монотонности внутри границы Коши
+       уравнения f(x) - y = 0, на концах которого f(x) - y меняет знак).
+    :return: Корни, число итераций (для опорных значений - вместе с шагами продолжения)
+    и признаки сходимости в исходном порядке targets.
+    """
+    targets = np.asarray(targets, dtype=float)
+    order = np.argsort(targets, kind='stable')
+    y = targets[order]
+    m = y.size
+
+    roots = np.full(m, np.nan)
+    iterations = np.zeros(m, dtype=np.int64)
+    converged = np.zeros(m, dtype=bool)
+    if m == 0:
+        return BatchResult(roots, iterations, converged)
+
+    # Продолжение по опорным значениям
+    anchor_index = np.unique(np.linspace(0, m - 1, min(anchors, m)).astype(np.int64))
+    anchor_roots = np.empty(anchor_index.size)
+    anchor_steps = np.zeros(anchor_index.size, dtype=np.int64)
+    x = float(initial_guess)
+    for k, i in enumerate(anchor_index):
+        for _ in range(max_iterations):
+            anchor_steps[k] += 1
+            f_x, f_prime_x = func.evaluate(x, 1)
+            if f_prime_x == 0:
+                # Критическая точка: шаг Ньютона не определён, смещаемся с неё
+                x += max(precision, 1e-3 * abs(x))
+                continue
+            step = (f_x - y[i]) / f_prime_x
+            x -= step
+            if not np.isfinite(x) or abs(step) <= precision:
+                break
+        anchor_roots[k] = x
+        if not np.isfinite(x):
+            # Расходимость для одного значения не должна портить начальные приближения следующих
+            x = float(initial_guess)
+    finite = np.isfinite(anchor_roots)
+    if finite.any():
+        x = np.interp(y, y[anchor_index[finite]], anchor_roots[finite])
+    else:
+        x = np.full(m, float(initial_guess))
+
+    # Векторный метод Ньютона для всех значений
+    active = np.arange(m)
+    y_active = y
+    counter = 0
+    while active.size and counter < max_iterations:
+        f_x, f_prime_x = func.evaluate(x, 1)
+        f_x = f_x - y_active
+        degenerate = f_prime_x == 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step = f_x / f_prime_x
+        # В критических точках вместо шага Ньютона - смещение
+        step[degenerate] = -np.maximum(precision, 1e-3 * np.abs(x[degenerate]))
+
+        done = ~degenerate & (np.abs(f_x) < precision) & (np.abs(step) <= precision)
+        roots[active[done]] = x[done]
+        iterations[active[done]] = counter
+        converged[active[done]] = True
+
+        keep = ~done & np.isfinite(x)
+        active, y_active = active[keep], y_active[keep]
+        x = x[keep] - step[keep]
+        counter += 1
+    iterations[active] = counter
+    # Опорные значения учитывают и шаги продолжения
+    iterations[anchor_index] += anchor_steps
+
+    # Бисекция для несошедшихся строк
+    failed = np.flatnonzero(~converged)
+    if failed.size and (bracket is not None or isinstance(func, Polynomial)):
+        if bracket is not None:
+            a = np.full(failed.size, float(bracket[0]))
+            b = np.full(failed.size, float(bracket[1]))
+        else:
+            # Отрезок [-R, R] разбивается критическими точками на участки монотонности,
+            # для каждого y выбирается первый участок, на концах которого f(x) - y меняет знак
+            c = func.coefficients
+            bound = 1 + max(np.max(np.abs(c[1:-1]), initial=0.0), np.max(np.abs(c[-1] - y[failed]))) / abs(c[0])
+            points = np.array([-bound] + [p for p in _critical_points(func) if -bound < p < bound] + [bound])
+            shifted = func(points)[None, :] - y[failed][:, None]
+            changes = shifted[:, :-1] * shifted[:, 1:] <= 0
+            interval = np.argmax(changes, axis=1)
+            a, b = points[interval], points[interval + 1]
+        f_a = func(a) - y[failed]
+        f_b = func(b) - y[failed]
+        valid = f_a * f_b <= 0
+        failed, a, b, f_a = failed[valid], a[valid], b[valid], f_a[valid]
+
+        counter = 0
+        while failed.size:
+            half_width = (b - a) / 2.0
+            midpoint = midpoint_of_interval(a, b)
+            f_mid = func(midpoint) - y[failed]
+
+            done = (f_mid == 0) | (half_width <= precision)
+            roots[failed[done]] = midpoint[done]
+            iterations[failed[done]] += counter
+            converged[failed[done]] = True
+
+            keep = ~done
+            failed, a, b, f_a = failed[keep], a[keep], b[keep], f_a[keep]
+            midpoint, f_mid = midpoint[keep], f_mid[keep]
+            left = f_a * f_mid < 0
+            b = np.where(left, midpoint, b)
+            a = np.where(left, a, midpoint)
+            f_a = np.where(left, f_a, f_mid)
+
+            counter += 1
+            if counter > max_iterations:
+                break
+
+    # Возвращаем результаты в исходном порядке
+    result_roots = np.empty(m)
+    result_iterations = np.empty(m, dtype=np.int64)
+    result_converged = np.empty(m, dtype=bool)
+    result_roots[order] = roots
+    result_iterations[order] = iterations
+    result_converged[order] = converged
+    return BatchResult(result_roots, result_iterations, result_converged)
@@ -64,10 +64,12 @@ def get_method(func: Func):
     print("1. Метод бисекции")
     print("2. Метод Ньютона")
     print("3. Оба метода")
+    print("4. Все корни (без начальных параметров)")
+    print("5. Все вещественные корни методом бисекции с автоматическим отделением")
 
     while True:
         try:
-            method = int(input("Введите номер метода (1, 2 или 3): "))
+            method = int(input("Введите номер метода (1, 2, 3, 4 или 5): "))
             if method == 1:
                 params = get_bisection_params(func)
                 return method, params
@@ -78,7 +80,9 @@ def get_method(func: Func):
                 bisection_params = get_bisection_params(func)
                 newton_params = get_newton_params(func)
                 return method, bisection_params, newton_params
+            elif method in (4, 5):
+                return method,
             else:
-                print("Пожалуйста, выберите один из вариантов (1, 2 или 3).")
+                print("Пожалуйста, выберите один из вариантов (1, 2, 3, 4 или 5).")
         except ValueError:
-            print("Ошибка ввода, пожалуйста, введите номер метода (1, 2 или 3).")
+            print("Ошибка ввода, пожалуйста, введите номер метода (1, 2, 3, 4 или 5).")
@@ -26,6 +26,10 @@ def main():
     elif method == 3:
         solver.bisection_method(*params[0])
         solver.newton_method(*params[1])
+    elif method == 4:
+        solver.all_roots()
+    elif method == 5:
+        solver.real_roots()
 
 
 def test():
@@ -34,6 +38,8 @@ def test():
     solver.plot_function()
     solver.bisection_method(a=-2, b=2)
     solver.newton_method(1)
+    solver.solve(-2, 2)
+    solver.all_roots()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,143 @@
+from typing import Callable
+
+import numpy as np
+
+from funcs import IterativeMethod
+
+# Поля записей итераций и заголовки методов решения систем
+SYSTEM_TRACE_COLUMNS = {
+    'system_newton': [('iteration', 'Iteration'), ('norm_f', '||F(x)||'), ('precision', 'precision')],
+    'broyden': [('iteration', 'Iteration'), ('norm_f', '||F(x)||'), ('precision', 'precision')],
+}
+
+SYSTEM_METHOD_TITLES = {
+    'system_newton': 'Решение системы методом Ньютона',
+    'broyden': 'Решение системы методом Бройдена',
+}
+
+
+class SystemSolver(IterativeMethod):
+    """
+    Решение систем нелинейных уравнений F(x) = 0, где F: R^n -> R^n.
+    Сходимость определяется так же, как в Solver.newton_method:
+    max|F(x)| < precision и max|dx| <= precision.
+    """
+
+    trace_columns = SYSTEM_TRACE_COLUMNS
+    method_titles = SYSTEM_METHOD_TITLES
+
+    def __init__(self, func: Callable[[np.ndarray], np.ndarray],
+                 jacobian: Callable[[np.ndarray], np.ndarray] | None = None,
+                 precision: float = 0.01, verbose: bool = True, trace: bool = True) -> None:
+        """
+        :param func: Векторная функция F(x).
+        :param jacobian: Функция, возвращающая матрицу Якоби; если не задана - конечные разности.
+        """
+        super().__init__(func, precision, verbose, trace)
+        self.jacobian = jacobian
+
+    def _F(self, x: np.ndarray) -> np.ndarray:
+        self.evaluations['f'] += 1
+        return np.asarray(self.func(x), dtype=float)
+
+    def _J(self, x: np.ndarray, f_x: np.ndarray) -> np.ndarray:
+        """Матрица Якоби: пользовательская или по конечным разностям вперёд (n вычислений F)."""
+        self.evaluations["f'"] += 1
+        if self.jacobian is not None:
+            return np.asarray(self.jacobian(x), dtype=float)
+
+        n = x.size
+        J = np.empty((f_x.size, n))
+        h = np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(x), 1.0)
+        x_h = x.copy()
+        for j in range(n):
+            x_h[j] = x[j] + h[j]
+            J[:, j] = (self._F(x_h) - f_x) / h[j]
+            x_h[j] = x[j]
+        return J
+
+    def newton_steps(self, initial_guess, max_iterations: int = 1000, jacobian_update: int = 1):
+        """
+        Итерации метода Ньютона для системы.
+        При jacobian_update = 1 матрица Якоби пересчитывается на каждой итерации и шаг находится
+        решением линейной системы (LU-разложение, около 2n^3/3 операций). При jacobian_update > 1
+        матрица пересчитывается и обращается раз в jacobian_update итераций, в остальных
+        итерациях используется сохранённая обратная матрица (O(n^2) на шаг).
+        :return: Генератор записей (iteration, ||F(x)||, precision);
+        по завершении возвращает тройку (решение, сообщение, признак успеха).
+        """
+        self._reset_evaluations()
+        x = np.array(initial_guess, dtype=float)
+        J_inv = None
+        counter = 0
+
+        while counter < max_iterations:
+            f_x = self._F(x)
+            try:
+                if jacobian_update == 1:
+                    step = np.linalg.solve(self._J(x, f_x), f_x)
+                else:
+                    if J_inv is None or counter % jacobian_update == 0:
+                        J_inv = np.linalg.inv(self._J(x, f_x))
+                    step = J_inv @ f_x
+            except np.linalg.LinAlgError:
+                return None, "Матрица Якоби вырождена; метод Ньютона не применим.", False
+
+            norm_f = np.max(np.abs(f_x))
+            precision = np.max(np.abs(step))
+            yield counter, norm_f, precision
+
+            if norm_f < self.precision and precision <= self.precision:
+                return x, f'Решение системы найдено за {counter} итераций', True
+
+            x = x - step
+            counter += 1
+
+        return None, "Метод Ньютона не сошелся за указанное число итераций.", False
+
+    def broyden_steps(self, initial_guess, max_iterations: int = 1000):
+        """
+        Итерации квазиньютоновского метода Бройдена.
+        Матрица Якоби вычисляется и обращается один раз, затем обратная матрица
+        уточняется поправками ранга 1 по формуле Шермана-Моррисона (O(n^2) на шаг).
+        :return: Генератор записей (iteration, ||F(x)||, precision);
+        по завершении возвращает тройку (решение, сообщение, признак успеха).
+        """
+        self._reset_evaluations()
+        x = np.array(initial_guess, dtype=float)
+        f_x = self._F(x)
+        try:
+            H = np.linalg.inv(self._J(x, f_x))
+        except np.linalg.LinAlgError:
+            return None, "Матрица Якоби вырождена; метод Бройдена не применим.", False
+
+        counter = 0
+        while counter < max_iterations:
+            step = -(H @ f_x)
+            norm_f = np.max(np.abs(f_x))
+            precision = np.max(np.abs(step))
+            yield counter, norm_f, precision
+
+            if norm_f < self.precision and precision <= self.precision:
+                return x, f'Решение системы найдено за {counter} итераций', True
+
+            x = x + step
+            f_new = self._F(x)
+            y = f_new - f_x
+            f_x = f_new
+
+            Hy = H @ y
+            denominator = step @ Hy
+            if denominator == 0:
+                return None, "Вырожденная поправка; метод Бройдена не применим.", False
+            H += np.outer(step - Hy, step @ H) / denominator
+            counter += 1
+
+        return None, "Метод Бройдена не сошелся за указанное число итераций.", False
+
+    def newton_method(self, initial_guess, max_iterations: int = 1000, jacobian_update: int = 1):
+        return self._run('system_newton', self.newton_steps(initial_guess, max_iterations, jacobian_update),
+                         max_iterations)
+
+    def broyden_method(self, initial_guess, max_iterations: int = 1000):
+        return self._run('broyden', self.broyden_steps(initial_guess, max_iterations), max_iterations)
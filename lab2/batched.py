@@ -0,0 +1,53 @@
+from typing import NamedTuple
+
+import numpy as np
+
+
+class BatchedSolution(NamedTuple):
+    x: np.ndarray  # Решения формы (m, n); для вырожденных систем - nan
+    singular: np.ndarray  # Признак вырожденности каждой системы
+
+
+def batched_solve(a, b) -> BatchedSolution:
+    """
+    Решение стопки независимых систем a[i] x[i] = b[i] методом Гаусса с выбором главного элемента.
+    Каждый шаг исключения выполняется векторно сразу для всех m систем, поэтому цикл
+    на Python идёт только по n столбцам. Вырожденные системы отмечаются, а не вызывают исключение.
+    :param a: Массив матриц формы (m, n, n); не изменяется.
+    :param b: Массив правых частей формы (m, n); не изменяется.
+    """
+    a = np.array(a, dtype=float)
+    b = np.array(b, dtype=float)
+    if a.ndim != 3 or a.shape[1] != a.shape[2] or b.shape != a.shape[:2]:
+        raise ValueError("Ожидаются матрицы формы (m, n, n) и правые части формы (m, n).")
+    m, n, _ = a.shape
+    systems = np.arange(m)
+    singular = np.zeros(m, dtype=bool)
+    # Порог вырожденности относительно масштаба матрицы
+    tolerance = n * np.finfo(float).eps * np.max(np.abs(a), axis=(1, 2))
+
+    # Прямой ход
+    for k in range(n):
+        # Поиск максимального элемента для избежания вырождения
+        p = k + np.argmax(np.abs(a[:, k:, k]), axis=1)
+        a[systems, k], a[systems, p] = a[systems, p], a[systems, k].copy()
+        b[systems, k], b[systems, p] = b[systems, p], b[systems, k].copy()
+
+        pivot = a[:, k, k]
+        zero = np.abs(pivot) <= tolerance
+        if zero.any():
+            singular |= zero
+            a[zero, k, k] = 1.0
+            pivot = a[:, k, k]
+
+        factors = a[:, k + 1:, k] / pivot[:, None]
+        a[:, k + 1:, k:] -= factors[:, :, None] * a[:, None, k, k:]
+        b[:, k + 1:] -= factors * b[:, k, None]
+
+    # Обратный ход
+    x = np.empty((m, n))
+    for i in range(n - 1, -1, -1):
+        x[:, i] = (b[:, i] - np.einsum('ij,ij->i', a[:, i, i + 1:], x[:, i + 1:])) / a[:, i, i]
+
+    x[singular] = np.nan
+    return BatchedSolution(x, singular)
@@ -0,0 +1,166 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from lu import LU, estimate_inverse_norm1, relative_residual
+
+
+def is_symmetric(a: np.ndarray, tolerance: float = 1e-12, samples: int = 64) -> bool:
+    """
+    Проверка симметричности: сначала несколько случайных пар a[i, j] и a[j, i],
+    и только если они совпали - полное сравнение с транспонированной матрицей.
+    """
+    n = a.shape[0]
+    if a.ndim != 2 or a.shape[1] != n:
+        return False
+    # Допуск относительный: масштаб - наибольший по модулю элемент матрицы
+    scale = tolerance * float(np.max(np.abs(a), initial=0.0))
+    rng = np.random.default_rng(0)
+    i, j = rng.integers(0, n, size=(2, min(samples, n * n)))
+    if np.any(np.abs(a[i, j] - a[j, i]) > scale):
+        return False
+    return bool(np.all(np.abs(a - a.T) <= scale))
+
+
+class _SymmetricFactorization(ABC):
+    """
+    Общая часть разложений A = L L^T и A = L D L^T.
+    Хранится только нижний треугольник: по одной панели из block_size столбцов
+    (строки от начала панели до n), так что память - около n^2 / 2 элементов.
+    Разложение левостороннее: панель исходной матрицы обновляется ранее найденными
+    панелями матричными умножениями, затем раскладывается её диагональный блок.
+    """
+
+    unit_diagonal = False
+
+    def __init__(self, a, block_size: int = 128) -> None:
+        a = np.asarray(a, dtype=float)
+        n = a.shape[0]
+        if a.ndim != 2 or a.shape[1] != n:
+            raise ValueError("Матрица системы должна быть квадратной.")
+        self.n = n
+        self.panels: list[np.ndarray] = []
+        self.d = np.ones(n)
+        self.bounds = [(start, min(start + block_size, n)) for start in range(0, n, block_size)]
+        # 1-норма исходной матрицы для оценки числа обусловленности
+        self.norm1 = float(np.max(np.abs(a).sum(axis=0), initial=0.0))
+        # Порог вырожденности ведущего элемента
+        self.tolerance = n * np.finfo(float).eps * float(np.max(np.abs(a), initial=0.0))
+
+        for k, (start, end) in enumerate(self.bounds):
+            # Из исходной матрицы читается только нижний треугольник
+            w = a[start:, start:end].copy()
+            for (j_start, j_end), panel in zip(self.bounds[:k], self.panels):
+                rows = panel[start - j_start:]
+                w -= rows @ (rows[:end - start] * self.d[j_start:j_end]).T
+
+            width = end - start
+            l11 = self._factor_block(w[:width], start)
+            below = np.linalg.solve(l11, w[width:].T).T
+            if self.unit_diagonal:
+                below /= self.d[start:end]
+            self.panels.append(np.vstack([l11, below]))
+
+    @abstractmethod
+    def _factor_block(self, block: np.ndarray, start: int) -> np.ndarray:
+        """Разложение диагонального блока панели, начинающейся со столбца start; возвращает его L."""
+
+    def solve(self, b) -> np.ndarray:
+        """Решение A x = b для вектора или матрицы правых частей; O(n^2)."""
+        x = np.array(b, dtype=float)
+        # Прямой ход: L y = b
+        for (start, end), panel in zip(self.bounds, self.panels):
+            width = end - start
+            x[start:end] = np.linalg.solve(panel[:width], x[start:end])
+            x[end:] -= panel[width:] @ x[start:end]
+        # Диагональ (для L D L^T)
+        if self.unit_diagonal:
+            x /= self.d.reshape((-1,) + (1,) * (x.ndim - 1))
+        # Обратный ход: L^T x = y
+        for (start, end), panel in zip(reversed(self.bounds), reversed(self.panels)):
+            width = end - start
+            x[start:end] = np.linalg.solve(panel[:width].T, x[start:end] - panel[width:].T @ x[end:])
+        return x
+
+    def condition_estimate(self) -> float:
+        """Оценка числа обусловленности ||A||_1 ||A^-1||_1 за O(n^2); A^T = A, поэтому только решения с A."""
+        return self.norm1 * estimate_inverse_norm1(self.solve, self.solve, self.n)
+
+    def determinant(self) -> float:
+        diagonal = np.concatenate([np.diag(panel[:end - start]) for (start, end), panel in
+                                   zip(self.bounds, self.panels)]) if self.panels else np.ones(0)
+        if self.unit_diagonal:
+            return float(np.prod(self.d))
+        return float(np.prod(diagonal) ** 2)
+
+
+class Cholesky(_SymmetricFactorization):
+    """Разложение Холецкого A = L L^T для симметричных положительно определённых матриц."""
+
+    def _factor_block(self, block: np.ndarray, start: int) -> np.ndarray:
+        try:
+            return np.linalg.cholesky(block)
+        except np.linalg.LinAlgError:
+            raise ValueError("Матрица не является положительно определённой.") from None
+
+
+class LDLT(_SymmetricFactorization):
+    """
+    Разложение A = L D L^T (L - нижняя унитреугольная, D - диагональная) для симметричных
+    знаконеопределённых матриц. Выполняется без перестановок, поэтому при малом ведущем
+    элементе выбрасывается ZeroDivisionError.
+    """
+
+    unit_diagonal = True
+
+    def _factor_block(self, block: np.ndarray, start: int) -> np.ndarray:
+        width = block.shape[0]
+        l = np.eye(width)
+        d = self.d[start:start + width]
+        for i in range(width):
+            d[i] = block[i, i] - (l[i, :i] * d[:i]) @ l[i, :i]
+            if abs(d[i]) <= self.tolerance:
+                raise ZeroDivisionError("Нулевой ведущий элемент в разложении L D L^T.")
+            l[i + 1:, i] = (block[i + 1:, i] - (l[i + 1:, :i] * d[:i]) @ l[i, :i]) / d[i]
+        return l
+
+
+def factorize(a, block_size: int = 128):
+    """
+    Выбор разложения по свойствам матрицы:
+    симметричная - Холецкий, при его неудаче - L D L^T, несимметричная или вырожденная - LU.
+    :return: Объект с методами solve, determinant и condition_estimate.
+    """
+    a = np.asarray(a, dtype=float)
+    if is_symmetric(a):
+        try:
+            return Cholesky(a, block_size)
+        except ValueError:
+            pass
+        try:
+            return LDLT(a, block_size)
+        except ZeroDivisionError:
+            pass
+    return LU(a, block_size)
+
+
+def factor_solve(a, b, block_size: int = 128):
+    """
+    Решение A x = b с автоматическим выбором разложения.
+    Симметричные разложения выполняются без перестановок, поэтому их результат
+    проверяется по невязке (O(n^2)) и при необходимости пересчитывается через LU.
+    :return: Решение и использованное разложение (для повторных решений и оценки обусловленности).
+    """
+    a = np.asarray(a, dtype=float)
+    factorization = factorize(a, block_size)
+    x = factorization.solve(b)
+    symmetric = isinstance(factorization, _SymmetricFactorization)
+    if symmetric and relative_residual(a, b, x) > 100 * a.shape[0] * np.finfo(float).eps:
+        factorization = LU(a, block_size)
+        x = factorization.solve(b)
+    return x, factorization
+
+
+def solve(a, b, block_size: int = 128) -> np.ndarray:
+    """Решение A x = b с автоматическим выбором разложения (см. factor_solve)."""
+    return factor_solve(a, b, block_size)[0]
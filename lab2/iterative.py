@@ -0,0 +1,269 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from sparse import SparseMatrix
+
+
+class IterativeResult(NamedTuple):
+    x: np.ndarray
+    iterations: int
+    converged: bool
+    residuals: np.ndarray  # Относительные невязки ||b - Ax|| / ||b|| по итерациям
+
+
+def _diagonal(a) -> np.ndarray:
+    return a.diagonal() if isinstance(a, SparseMatrix) else np.diag(a).copy()
+
+
+def _rows(a):
+    """Строки матрицы в виде пар (столбцы, значения) для построчных методов."""
+    if isinstance(a, SparseMatrix):
+        for i in range(a.shape[0]):
+            start, end = a.indptr[i], a.indptr[i + 1]
+            yield a.indices[start:end], a.data[start:end]
+    else:
+        columns = np.arange(a.shape[1])
+        for row in a:
+            yield columns, row
+
+
+def _prepare(a, b, x0):
+    if not isinstance(a, SparseMatrix):
+        a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    x = np.zeros_like(b) if x0 is None else np.array(x0, dtype=float)
+    norm_b = np.linalg.norm(b)
+    return a, b, x, norm_b if norm_b > 0 else 1.0
+
+
+class JacobiPreconditioner:
+    """Предобусловливатель Якоби: M = diag(A)."""
+
+    def __init__(self, a) -> None:
+        diagonal = _diagonal(a)
+        if np.any(diagonal == 0):
+            raise ZeroDivisionError("На диагонали матрицы есть нулевые элементы.")
+        self.inverse_diagonal = 1.0 / diagonal
+
+    def apply(self, r: np.ndarray) -> np.ndarray:
+        return self.inverse_diagonal * r
+
+
+class ILU0Preconditioner:
+    """
+    Неполное LU-разложение без заполнения: множители L и U имеют тот же шаблон
+    ненулевых элементов, что и A. Плотная матрица приводится к SparseMatrix.
+    """
+
+    def __init__(self, a) -> None:
+        matrix = a if isinstance(a, SparseMatrix) else SparseMatrix.from_dense(a)
+        n = matrix.shape[0]
+        data = matrix.data.copy()
+        indptr, indices = matrix.indptr, matrix.indices
+        diagonal_position = np.full(n, -1, dtype=np.int64)
+
+        for i in range(n):
+            start, end = indptr[i], indptr[i + 1]
+            position = {int(col): k for k, col in zip(range(start, end), indices[start:end])}
+            for k in range(start, end):
+                col = indices[k]
+                if col >= i:
+                    break
+                # l_ik = a_ik / u_kk
+                data[k] /= data[diagonal_position[col]]
+                # a_ij -= l_ik * u_kj для j из шаблона строки i
+                for t in range(diagonal_position[col] + 1, indptr[col + 1]):
+                    j = int(indices[t])
+                    if j in position:
+                        data[position[j]] -= data[k] * data[t]
+            if i not in position or data[position[i]] == 0:
+                raise ZeroDivisionError("Нулевой ведущий элемент в неполном LU-разложении.")
+            diagonal_position[i] = position[i]
+
+        self.n = n
+        self.data, self.indices, self.indptr = data, indices, indptr
+        self.diagonal_position = diagonal_position
+
+    def apply(self, r: np.ndarray) -> np.ndarray:
+        data, indices, indptr, diagonal = self.data, self.indices, self.indptr, self.diagonal_position
+        y = np.array(r, dtype=float)
+        for i in range(self.n):
+            start, middle = indptr[i], diagonal[i]
+            y[i] -= data[start:middle] @ y[indices[start:middle]]
+        for i in range(self.n - 1, -1, -1):
+            middle, end = diagonal[i], indptr[i + 1]
+            y[i] = (y[i] - data[middle + 1:end] @ y[indices[middle + 1:end]]) / data[middle]
+        return y
+
+
+def make_preconditioner(a, kind: str | None):
+    """
+    :param kind: None, 'jacobi' или 'ilu0'.
+    """
+    if kind is None:
+        return None
+    if kind == 'jacobi':
+        return JacobiPreconditioner(a)
+    if kind == 'ilu0':
+        return ILU0Preconditioner(a)
+    raise ValueError(f"Неизвестный предобусловливатель '{kind}'.")
+
+
+def jacobi(a, b, x0=None, precision: float = 1e-8, max_iterations: int = 1000) -> IterativeResult:
+    """
+    Метод Якоби: x = x + D^-1 (b - A x).
+    Сходится для матриц с диагональным преобладанием.
+    """
+    a, b, x, norm_b = _prepare(a, b, x0)
+    inverse_diagonal = JacobiPreconditioner(a).inverse_diagonal
+    residuals = np.empty(max_iterations + 1)
+
+    r = b - a @ x
+    residuals[0] = np.linalg.norm(r) / norm_b
+    for k in range(1, max_iterations + 1):
+        if residuals[k - 1] <= precision:
+            return IterativeResult(x, k - 1, True, residuals[:k])
+        x = x + inverse_diagonal * r
+        r = b - a @ x
+        residuals[k] = np.linalg.norm(r) / norm_b
+
+    converged = residuals[max_iterations] <= precision
+    return IterativeResult(x, max_iterations, converged, residuals)
+
+
+def sor(a, b, x0=None, omega: float = 1.0, precision: float = 1e-8,
+        max_iterations: int = 1000) -> IterativeResult:
+    """
+    Метод последовательной верхней релаксации; при omega = 1 - метод Гаусса-Зейделя.
+    :param omega: Параметр релаксации, 0 < omega < 2.
+    """
+    if not 0 < omega < 2:
+        raise ValueError("Параметр релаксации должен лежать в интервале (0, 2).")
+    a, b, x, norm_b = _prepare(a, b, x0)
+    diagonal = _diagonal(a)
+    if np.any(diagonal == 0):
+        raise ZeroDivisionError("На диагонали матрицы есть нулевые элементы.")
+    residuals = np.empty(max_iterations + 1)
+
+    residuals[0] = np.linalg.norm(b - a @ x) / norm_b
+    for k in range(1, max_iterations + 1):
+        if residuals[k - 1] <= precision:
+            return IterativeResult(x, k - 1, True, residuals[:k])
+        for i, (columns, values) in enumerate(_rows(a)):
+            # Используются уже обновлённые компоненты x
+            x[i] += omega * (b[i] - values @ x[columns]) / diagonal[i]
+        residuals[k] = np.linalg.norm(b - a @ x) / norm_b
+
+    converged = residuals[max_iterations] <= precision
+    return IterativeResult(x, max_iterations, converged, residuals)
+
+
+def gauss_seidel(a, b, x0=None, precision: float = 1e-8, max_iterations: int = 1000) -> IterativeResult:
+    """Метод Гаусса-Зейделя."""
+    return sor(a, b, x0, 1.0, precision, max_iterations)
+
+
+def conjugate_gradient(a, b, x0=None, precision: float = 1e-8, max_iterations: int = 1000,
+                       preconditioner: str | None = None) -> IterativeResult:
+    """
+    Метод сопряжённых градиентов (с предобусловливанием) для симметричных положительно определённых матриц.
+    :param preconditioner: None, 'jacobi' или 'ilu0'.
+    """
+    a, b, x, norm_b = _prepare(a, b, x0)
+    M = make_preconditioner(a, preconditioner)
+    residuals = np.empty(max_iterations + 1)
+
+    r = b - a @ x
+    z = M.apply(r) if M else r
+    p = z.copy()
+    rz = r @ z
+    residuals[0] = np.linalg.norm(r) / norm_b
+    for k in range(1, max_iterations + 1):
+        if residuals[k - 1] <= precision:
+            return IterativeResult(x, k - 1, True, residuals[:k])
+        Ap = a @ p
+        pAp = p @ Ap
+        if pAp <= 0:
+            raise ValueError("Матрица не является положительно определённой.")
+        alpha = rz / pAp
+        x = x + alpha * p
+        r = r - alpha * Ap
+        residuals[k] = np.linalg.norm(r) / norm_b
+
+        z = M.apply(r) if M else r
+        rz_new = r @ z
+        p = z + (rz_new / rz) * p
+        rz = rz_new
+
+    converged = residuals[max_iterations] <= precision
+    return IterativeResult(x, max_iterations, converged, residuals)
+
+
+def gmres(a, b, x0=None, precision: float = 1e-8, max_iterations: int = 1000, restart: int = 30,
+          preconditioner: str | None = None) -> IterativeResult:
+    """
+    Обобщённый метод минимальных невязок с перезапуском через restart итераций
+    и правым предобусловливанием. Подходит для несимметричных матриц.
+    :param preconditioner: None, 'jacobi' или 'ilu0'.
+    """
+    a, b, x, norm_b = _prepare(a, b, x0)
+    M = make_preconditioner(a, preconditioner)
+    n = b.size
+    restart = min(restart, n)
+    residuals = np.empty(max_iterations + 1)
+
+    r = b - a @ x
+    beta = np.linalg.norm(r)
+    residuals[0] = beta / norm_b
+    k = 0
+    while residuals[k] > precision and k < max_iterations:
+        V = np.zeros((restart + 1, n))
+        H = np.zeros((restart + 1, restart))
+        cs = np.zeros(restart)
+        sn = np.zeros(restart)
+        g = np.zeros(restart + 1)
+        g[0] = beta
+        V[0] = r / beta
+
+        j = 0
+        while j < restart and k < max_iterations:
+            # Процесс Арнольди с модифицированной ортогонализацией Грама-Шмидта
+            w = a @ (M.apply(V[j]) if M else V[j])
+            for i in range(j + 1):
+                H[i, j] = w @ V[i]
+                w -= H[i, j] * V[i]
+            H[j + 1, j] = np.linalg.norm(w)
+            if H[j + 1, j] != 0:
+                V[j + 1] = w / H[j + 1, j]
+
+            # Вращения Гивенса приводят H к верхнетреугольному виду
+            for i in range(j):
+                H[i, j], H[i + 1, j] = cs[i] * H[i, j] + sn[i] * H[i + 1, j], \
+                    -sn[i] * H[i, j] + cs[i] * H[i + 1, j]
+            denominator = np.hypot(H[j, j], H[j + 1, j])
+            cs[j], sn[j] = H[j, j] / denominator, H[j + 1, j] / denominator
+            H[j, j] = denominator
+            H[j + 1, j] = 0
+            g[j], g[j + 1] = cs[j] * g[j], -sn[j] * g[j]
+
+            j += 1
+            k += 1
+            residuals[k] = abs(g[j]) / norm_b
+            if residuals[k] <= precision:
+                break
+
+        # Решение треугольной системы и обновление x
+        y = np.zeros(j)
+        for i in range(j - 1, -1, -1):
+            y[i] = (g[i] - H[i, i + 1:j] @ y[i + 1:]) / H[i, i]
+        update = y @ V[:j]
+        x = x + (M.apply(update) if M else update)
+
+        r = b - a @ x
+        beta = np.linalg.norm(r)
+        residuals[k] = beta / norm_b
+        if beta == 0:
+            break
+
+    return IterativeResult(x, k, bool(residuals[k] <= precision), residuals[:k + 1])
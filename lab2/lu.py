@@ -0,0 +1,327 @@
+from typing import NamedTuple
+
+import numpy as np
+
+
+class LU:
+    """
+    LU-разложение с выбором главного элемента по столбцу: P A = L U.
+    Разложение выполняется один раз за O(n^3), после чего каждое решение
+    для новой правой части стоит O(n^2).
+    """
+
+    def __init__(self, a, block_size: int = 128, dtype=np.float64) -> None:
+        """
+        :param a: Квадратная матрица системы (список списков или массив NumPy); не изменяется.
+        :param block_size: Ширина блока. Матрица раскладывается блочно: панель из block_size
+        столбцов обрабатывается построчно, а основная работа - обновление оставшейся
+        подматрицы - выполняется одним матричным умножением (BLAS-3, все ядра).
+        :param dtype: Тип элементов разложения; np.float32 вдвое уменьшает память и объём передаваемых данных.
+        """
+        lu = np.array(a, dtype=dtype)
+        if lu.ndim != 2 or lu.shape[0] != lu.shape[1]:
+            raise ValueError("Матрица системы должна быть квадратной.")
+        n = lu.shape[0]
+        perm = np.arange(n)
+
+        for k in range(0, n, block_size):
+            end = min(k + block_size, n)
+            self._factor_panel(lu, perm, k, end)
+            if end == n:
+                break
+
+            # U12 = L11^-1 A12 (L11 - нижняя унитреугольная)
+            l11 = np.tril(lu[k:end, k:end], -1) + np.eye(end - k, dtype=lu.dtype)
+            lu[k:end, end:] = np.linalg.solve(l11, lu[k:end, end:])
+            # A22 -= L21 U12
+            lu[end:, end:] -= lu[end:, k:end] @ lu[k:end, end:]
+
+        self.lu = lu
+        self.perm = perm
+        self.n = n
+        # 1-норма исходной матрицы для оценки числа обусловленности
+        self.norm1 = float(np.max(np.abs(np.asarray(a, dtype=float)).sum(axis=0), initial=0.0))
+
+    @classmethod
+    def from_factors(cls, lu: np.ndarray, perm: np.ndarray, norm1: float) -> 'LU':
+        """
+        Разложение из готовых множителей (например, найденных методом Гаусса с выводом шагов).
+        :param lu: Множители L под диагональю и U на диагонали и выше, P A = L U.
+        :param perm: Перестановка строк: строка i матрицы P A - строка perm[i] матрицы A.
+        :param norm1: 1-норма исходной матрицы.
+        """
+        factorization = cls.__new__(cls)
+        factorization.lu = np.asarray(lu)
+        factorization.perm = np.asarray(perm)
+        factorization.n = factorization.lu.shape[0]
+        factorization.norm1 = float(norm1)
+        return factorization
+
+    @staticmethod
+    def _factor_panel(lu: np.ndarray, perm: np.ndarray, start: int, end: int) -> None:
+        """Разложение столбцов start..end-1; перестановки строк применяются ко всей матрице."""
+        for i in range(start, end):
+            # Поиск максимального элемента для избежания вырождения
+            max_row = i + int(np.argmax(np.abs(lu[i:, i])))
+            if lu[max_row, i] == 0:
+                raise ZeroDivisionError("Матрица системы вырождена, решение не найдено.")
+            if max_row != i:
+                lu[[i, max_row]] = lu[[max_row, i]]
+                perm[[i, max_row]] = perm[[max_row, i]]
+
+            # Множители сохраняются на месте обнулённых элементов
+            lu[i + 1:, i] /= lu[i, i]
+            lu[i + 1:, i + 1:end] -= np.outer(lu[i + 1:, i], lu[i, i + 1:end])
+
+    @property
+    def L(self) -> np.ndarray:
+        return np.tril(self.lu, -1) + np.eye(self.n)
+
+    @property
+    def U(self) -> np.ndarray:
+        return np.triu(self.lu)
+
+    def solve(self, b) -> np.ndarray:
+        """
+        Решение A x = b для одной или нескольких правых частей.
+        :param b: Вектор длины n или матрица n x k (по столбцу на каждую правую часть).
+        :return: Решение той же формы, что и b.
+        """
+        b = np.asarray(b, dtype=float)
+        if b.shape[0] != self.n:
+            raise ValueError("Размер правой части не совпадает с размером матрицы.")
+        x = b[self.perm].astype(self.lu.dtype)
+        lu = self.lu
+
+        # Прямой ход: L y = P b
+        for i in range(1, self.n):
+            x[i] -= lu[i, :i] @ x[:i]
+
+        # Обратный ход: U x = y
+        for i in range(self.n - 1, -1, -1):
+            x[i] -= lu[i, i + 1:] @ x[i + 1:]
+            x[i] /= lu[i, i]
+
+        return x
+
+    def solve_transpose(self, b) -> np.ndarray:
+        """Решение A^T x = b: U^T z = b, L^T w = z, x = P^T w."""
+        lu = self.lu
+        x = np.asarray(b, dtype=float).astype(lu.dtype)
+
+        for i in range(self.n):
+            x[i] -= lu[:i, i] @ x[:i]
+            x[i] /= lu[i, i]
+        for i in range(self.n - 1, -1, -1):
+            x[i] -= lu[i + 1:, i] @ x[i + 1:]
+
+        result = np.empty_like(x)
+        result[self.perm] = x
+        return result
+
+    def condition_estimate(self) -> float:
+        """
+        Оценка числа обусловленности ||A||_1 ||A^-1||_1 методом Хейгера-Хайэма:
+        несколько решений с A и A^T вместо обращения матрицы, O(n^2).
+        """
+        return self.norm1 * estimate_inverse_norm1(self.solve, self.solve_transpose, self.n)
+
+    def determinant(self) -> float:
+        """Определитель: произведение ведущих элементов с учётом чётности перестановки строк."""
+        return _permutation_sign(self.perm) * float(np.prod(np.diag(self.lu), dtype=float))
+
+    def inverse(self) -> np.ndarray:
+        """Обратная матрица по готовому разложению (n решений за O(n^2) каждое)."""
+        return self.solve(np.eye(self.n))
+
+
+def estimate_inverse_norm1(solve, solve_transpose, n: int) -> float:
+    """
+    Оценка ||A^-1||_1 методом Хейгера-Хайэма по готовому разложению.
+    :param solve: Решение A x = b.
+    :param solve_transpose: Решение A^T x = b (для симметричных матриц совпадает с solve).
+    :param n: Размер матрицы.
+    """
+    x = np.full(n, 1.0 / n)
+    estimate = 0.0
+    for _ in range(5):
+        y = solve(x).astype(float)
+        estimate = float(np.abs(y).sum())
+        z = solve_transpose(np.sign(y) + (y == 0)).astype(float)
+        j = int(np.argmax(np.abs(z)))
+        if abs(z[j]) <= z @ x:
+            break
+        x = np.zeros(n)
+        x[j] = 1.0
+    return estimate
+
+
+def _permutation_sign(perm: np.ndarray) -> int:
+    """Знак перестановки: (-1) в степени (n - число циклов)."""
+    visited = np.zeros(perm.size, dtype=bool)
+    sign = 1
+    for start in range(perm.size):
+        if visited[start]:
+            continue
+        length = 0
+        i = start
+        while not visited[i]:
+            visited[i] = True
+            i = perm[i]
+            length += 1
+        if length % 2 == 0:
+            sign = -sign
+    return sign
+
+
+class UpdatableLU:
+    """
+    Разложение матрицы A = A0 + left right^T, допускающее изменения малого ранга без повторного
+    разложения. A0 раскладывается один раз, поправки учитываются по формуле
+    Шермана-Моррисона-Вудбери: добавление поправки ранга k стоит O(k n^2),
+    решение - O(n^2 + k n). При накоплении поправок ранга больше max_rank
+    матрица раскладывается заново.
+    """
+
+    def __init__(self, a, max_rank: int = 32) -> None:
+        self.a = np.array(a, dtype=float)
+        self.max_rank = max_rank
+        self._refactor()
+
+    def _refactor(self) -> None:
+        self.base = LU(self.a)
+        n = self.a.shape[0]
+        # Множители поправки малого ранга (не путать с множителями L и U разложения)
+        self.left = np.empty((n, 0))
+        self.right = np.empty((n, 0))
+        self.Z = np.empty((n, 0))  # Z = A0^-1 left
+        self.capacitance = LU(np.empty((0, 0)))  # I + right^T Z
+
+    @property
+    def n(self) -> int:
+        return self.a.shape[0]
+
+    @property
+    def rank(self) -> int:
+        return self.left.shape[1]
+
+    def update(self, u, v) -> None:
+        """
+        Изменение матрицы на u v^T.
+        :param u: Вектор длины n или матрица n x k.
+        :param v: Вектор длины n или матрица n x k.
+        """
+        u = np.asarray(u, dtype=float).reshape(self.n, -1)
+        v = np.asarray(v, dtype=float).reshape(self.n, -1)
+        self.a += u @ v.T
+        if self.rank + u.shape[1] > self.max_rank:
+            self._refactor()
+            return
+
+        self.left = np.hstack([self.left, u])
+        self.right = np.hstack([self.right, v])
+        self.Z = np.hstack([self.Z, self.base.solve(u)])
+        self.capacitance = LU(np.eye(self.rank) + self.right.T @ self.Z)
+
+    def downdate(self, u, v) -> None:
+        """
+        Отмена ранее внесённого изменения u v^T.
+        Если среди накопленных поправок есть столбцы, совпадающие с u и v, они удаляются
+        (ранг уменьшается, O(n k^2) на пересчёт I + right^T Z). Иначе - например, после повторного
+        разложения - выполняется обычное изменение на -u v^T.
+        """
+        u = np.asarray(u, dtype=float).reshape(self.n, -1)
+        v = np.asarray(v, dtype=float).reshape(self.n, -1)
+        k = u.shape[1]
+        for start in range(self.rank - k, -1, -1):
+            columns = slice(start, start + k)
+            if np.array_equal(self.left[:, columns], u) and np.array_equal(self.right[:, columns], v):
+                self.a -= u @ v.T
+                keep = np.r_[0:start, start + k:self.rank]
+                self.left = self.left[:, keep]
+                self.right = self.right[:, keep]
+                self.Z = self.Z[:, keep]
+                self.capacitance = LU(np.eye(self.rank) + self.right.T @ self.Z)
+                return
+        self.update(-u, v)
+
+    def update_row(self, i: int, row) -> None:
+        """Замена строки i матрицы (поправка ранга 1)."""
+        e = np.zeros(self.n)
+        e[i] = 1.0
+        self.update(e, np.asarray(row, dtype=float) - self.a[i])
+
+    def update_column(self, j: int, column) -> None:
+        """Замена столбца j матрицы (поправка ранга 1)."""
+        e = np.zeros(self.n)
+        e[j] = 1.0
+        self.update(np.asarray(column, dtype=float) - self.a[:, j], e)
+
+    def solve(self, b) -> np.ndarray:
+        """x = A0^-1 b - Z (I + right^T Z)^-1 right^T A0^-1 b для вектора или матрицы правых частей."""
+        y = self.base.solve(b)
+        if self.rank == 0:
+            return y
+        return y - self.Z @ self.capacitance.solve(self.right.T @ y)
+
+    def determinant(self) -> float:
+        """Определитель по лемме об определителе матрицы: det(A0) det(I + right^T Z)."""
+        if self.rank == 0:
+            return self.base.determinant()
+        return self.base.determinant() * self.capacitance.determinant()
+
+    def inverse(self) -> np.ndarray:
+        return self.solve(np.eye(self.n))
+
+
+class RefinedSolution(NamedTuple):
+    x: np.ndarray
+    iterations: int  # Число шагов уточнения
+    residual: float  # Относительная невязка ||b - Ax|| / (||A|| ||x|| + ||b||)
+    condition: float  # Оценка числа обусловленности
+    mixed: bool  # Удалось ли обойтись разложением в float32
+
+
+def relative_residual(a, b, x) -> float:
+    """Нормированная невязка ||b - Ax||_inf / (||A||_inf ||x||_inf + ||b||_inf), вычисляется в float64."""
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    x = np.asarray(x, dtype=float)
+    r = b - a @ x
+    norm_a = np.max(np.abs(a).sum(axis=1), initial=0.0)
+    denominator = norm_a * np.max(np.abs(x), initial=0.0) + np.max(np.abs(b), initial=0.0)
+    return float(np.max(np.abs(r), initial=0.0) / denominator) if denominator else 0.0
+
+
+def mixed_precision_solve(a, b, precision: float | None = None, max_iterations: int = 10) -> RefinedSolution:
+    """
+    Решение A x = b с разложением в одинарной точности и итерационным уточнением до двойной:
+    невязка r = b - A x считается в float64, поправка находится по готовому float32-разложению.
+    Если уточнение не сходится (плохо обусловленная матрица), система решается в float64.
+    :param precision: Требуемая относительная невязка; по умолчанию sqrt(n) * eps(float64).
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    n = a.shape[0]
+    if precision is None:
+        precision = np.sqrt(n) * np.finfo(np.float64).eps
+
+    lu = LU(a, dtype=np.float32)
+    x = lu.solve(b).astype(np.float64)
+    residual = relative_residual(a, b, x)
+    previous = np.inf
+    iterations = 0
+    while residual > precision and iterations < max_iterations:
+        # Уточнение перестало уменьшать невязку
+        if residual >= previous / 2:
+            break
+        x += lu.solve(b - a @ x)
+        previous, residual = residual, relative_residual(a, b, x)
+        iterations += 1
+
+    if residual <= precision:
+        return RefinedSolution(x, iterations, residual, lu.condition_estimate(), True)
+
+    lu = LU(a)
+    x = lu.solve(b)
+    return RefinedSolution(x, iterations, relative_residual(a, b, x), lu.condition_estimate(), False)
@@ -1,52 +1,118 @@
+import time
+
+import numpy as np
 from tabulate import tabulate
 
+from cholesky import factor_solve, factorize
+from lu import LU, relative_residual
+from sparse import SparseMatrix, SparseLU
+
 
-def check(a,b,x):
-    res = 0
-    for i,_a in enumerate(a[0]):
-        res += _a*x[i]
+def check(a, b, x, factorization=None):
+    """
+    Проверка решения по всем уравнениям: нормированная невязка и оценка числа обусловленности.
+    Обе величины вычисляются за O(n^2), если передано разложение.
+    :param factorization: Разложение матрицы a, найденное при решении (LU, Cholesky или LDLT);
+    если не задано, матрица раскладывается заново за O(n^3).
+    """
+    residual = relative_residual(a, b, x)
+    condition = (factorization or factorize(a)).condition_estimate()
     print("Проверка:")
-    if res == b[0]:
+    print(f"Относительная невязка: {residual:.3e}")
+    print(f"Оценка числа обусловленности: {condition:.3e}")
+    # Допустимая невязка обратно устойчивого метода - несколько машинных эпсилон
+    if residual <= 100 * len(b) * np.finfo(float).eps:
         print("Корни верны")
     else:
         print("Корни не верны")
     print()
+    return residual, condition
+
 
+# Максимальный размер системы, для которой выводятся промежуточные шаги
+MAX_PRINT_SIZE = 10
 
-def gauss_elimination(a: list[list[float]], b: list[float]):
+
+def gauss_elimination(a: list[list[float]], b: list[float], verbose: bool = False,
+                      return_factorization: bool = False):
+    """
+    Решение системы методом Гаусса.
+    :param verbose: Выводить промежуточные шаги (только для n <= MAX_PRINT_SIZE).
+    Без вывода шагов разложение выбирается автоматически: для симметричных
+    матриц - Холецкий или L D L^T, иначе блочное LU-разложение.
+    :param return_factorization: Вернуть также разложение матрицы (например, для check).
+    :return: Решение или пара (решение, разложение).
+    """
     n = len(b)
+    if not verbose or n > MAX_PRINT_SIZE:
+        x, factorization = factor_solve(a, b)
+        return (x.tolist(), factorization) if return_factorization else x.tolist()
+
+    # Расширенная матрица [a | b]
+    ab = np.column_stack([np.array(a, dtype=float), np.array(b, dtype=float)])
+    # Множители и перестановка строк сохраняются как LU-разложение
+    multipliers = np.zeros((n, n))
+    perm = np.arange(n)
+
     # Прямой ход метода Гаусса
     for i in range(n):
         # Поиск максимального элемента для избежания вырождения
-        max_row = i
-        for k in range(i + 1, n):
-            if abs(a[k][i]) > abs(a[max_row][i]):
-                max_row = k
+        max_row = i + int(np.argmax(np.abs(ab[i:, i])))
         # Поменять строки местами
-        a[i], a[max_row] = a[max_row], a[i]
-        b[i], b[max_row] = b[max_row], b[i]
+        ab[[i, max_row]] = ab[[max_row, i]]
+        multipliers[[i, max_row]] = multipliers[[max_row, i]]
+        perm[[i, max_row]] = perm[[max_row, i]]
+        if ab[i, i] == 0:
+            raise ZeroDivisionError("Матрица системы вырождена, решение не найдено.")
 
         # Обнуление элементов ниже текущего
-        for k in range(i + 1, n):
-            factor = a[k][i] / a[i][i]
-            for j in range(i, n):
-                a[k][j] -= factor * a[i][j]
-            b[k] -= factor * b[i]
+        factors = ab[i + 1:, i] / ab[i, i]
+        multipliers[i + 1:, i] = factors
+        ab[i + 1:, i:] -= np.outer(factors, ab[i, i:])
 
         # Отображение промежуточных шагов
         print(f"Шаг {i + 1}:")
-        print(tabulate([row + [b[i]] for i, row in enumerate(a)], headers=[f"x{j + 1}" for j in range(n)] + ["b"]))
+        print(tabulate(ab.tolist(), headers=[f"x{j + 1}" for j in range(n)] + ["b"]))
         print()
 
     # Обратный ход
-    x: list[float] = [0] * n
+    x = np.zeros(n)
     for i in range(n - 1, -1, -1):
-        x[i] = b[i]
-        for j in range(i + 1, n):
-            x[i] -= a[i][j] * x[j]
-        x[i] /= a[i][i]
+        x[i] = (ab[i, n] - ab[i, i + 1:n] @ x[i + 1:]) / ab[i, i]
+
+    if not return_factorization:
+        return x.tolist()
+    norm1 = float(np.max(np.abs(np.asarray(a, dtype=float)).sum(axis=0), initial=0.0))
+    return x.tolist(), LU.from_factors(np.triu(ab[:, :n]) + multipliers, perm, norm1)
+
+
+def solve_many(a: list[list[float]], bs) -> np.ndarray:
+    """
+    Решение системы с одной матрицей для многих правых частей:
+    матрица раскладывается один раз, каждая правая часть решается за O(n^2).
+    :param a: Матрица системы.
+    :param bs: Вектор или матрица n x k правых частей (по столбцу на систему).
+    """
+    return LU(a).solve(bs)
 
-    return x
+
+def solve_sparse(a, b) -> np.ndarray:
+    """
+    Решение разреженной системы: RCM-упорядочение и ленточное LU-разложение.
+    Память - O(n * ширина ленты), поэтому метод подходит для матриц с узкой лентой.
+    :param a: SparseMatrix или плотная матрица (например, результат _input).
+    """
+    matrix = a if isinstance(a, SparseMatrix) else SparseMatrix.from_dense(a)
+    return SparseLU(matrix).solve(b)
+
+
+def load_sparse_system(matrix_path: str, rhs_path: str) -> tuple[SparseMatrix, np.ndarray]:
+    """
+    Загрузка разреженной системы из файлов.
+    :param matrix_path: Матрица в координатном формате Matrix Market.
+    :param rhs_path: Правая часть - по одному числу в строке.
+    """
+    return SparseMatrix.from_matrix_market(matrix_path), np.loadtxt(rhs_path, ndmin=1)
 
 
 def _input() -> tuple[list[list[float]], list[float]]:
@@ -100,13 +166,40 @@ def test():
     print(tabulate([row + [b[i]] for i, row in enumerate(a)], headers=[f"x{j + 1}" for j in range(n)] + ["b"]))
     print()
 
-    solution = gauss_elimination(a, b)
+    solution = gauss_elimination(a, b, verbose=True)
 
     print("Решение:")
     for i in range(n):
         print(f"x{i + 1} = {solution[i]}")
 
 
+def benchmark(sizes=(500, 1000, 2000), block_size: int = 128):
+    """
+    Замер времени решения случайных систем разного размера блочным LU-разложением.
+    :return: Список строк (n, время разложения, время решения, GFLOP/s, относительная невязка).
+    """
+    rng = np.random.default_rng(0)
+    rows = []
+    for n in sizes:
+        a = rng.standard_normal((n, n))
+        b = rng.standard_normal(n)
+
+        start = time.perf_counter()
+        lu = LU(a, block_size)
+        factor_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        x = lu.solve(b)
+        solve_time = time.perf_counter() - start
+
+        gflops = 2 * n ** 3 / 3 / factor_time / 1e9
+        residual = np.linalg.norm(a @ x - b) / (np.linalg.norm(a) * np.linalg.norm(x))
+        rows.append((n, factor_time, solve_time, gflops, residual))
+
+    print(tabulate(rows, headers=["n", "Разложение, с", "Решение, с", "GFLOP/s", "Невязка"]))
+    return rows
+
+
 def main():
     a, b = _input()
 
@@ -116,11 +209,11 @@ def main():
     _a = [[n for n in x] for x in a]
     _b = [x + 0 for x in b]
     try:
-        solution = gauss_elimination(_a, _b)
+        solution, factorization = gauss_elimination(_a, _b, verbose=True, return_factorization=True)
     except Exception as e:
         print("Решение не найдено")
         return
-    check(a,b,solution)
+    check(a, b, solution, factorization)
 
     print("Решение:")
     for i in range(len(a)):
@@ -0,0 +1,155 @@
+import numpy as np
+
+
+def _swap_permutation(ipiv: np.ndarray, start: int, end: int, n: int, inverse: bool = False) -> np.ndarray:
+    """
+    Перестановка rows, для которой block[rows] совпадает с последовательным применением
+    перестановок строк i <-> ipiv[i], i из [start, end). При inverse=True - обратная к ней.
+    """
+    rows = np.arange(n)
+    indices = range(end - 1, start - 1, -1) if inverse else range(start, end)
+    for i in indices:
+        p = ipiv[i]
+        rows[i], rows[p] = rows[p], rows[i]
+    return rows
+
+
+def _gather_rows(source: np.ndarray, rows: np.ndarray, out: np.ndarray) -> None:
+    """out = source[rows] по столбцам: np.take для двумерного среза копирует его целиком."""
+    for c in range(out.shape[1]):
+        np.take(source[:, c], rows, out=out[:, c])
+
+
+class OutOfCoreLU:
+    """
+    LU-разложение матрицы, не помещающейся в оперативную память.
+    Множители хранятся в файле path (numpy.memmap, по столбцам). В памяти находятся три заранее
+    выделенных буфера n x panel_width: текущая панель, одна из ранее найденных панелей L и
+    произведение для обновления, - плюс O(n) индексов перестановок и O(panel_width^2) для
+    диагональных блоков. panel_width выбирается так, чтобы три буфера занимали не больше
+    memory_budget. Используется левосторонний
+    вариант: текущая панель читается с диска, к ней применяются все ранее найденные панели L,
+    затем она раскладывается с выбором главного элемента и записывается обратно.
+    """
+
+    def __init__(self, matrix, path: str, memory_budget: int = 256 * 2 ** 20, dtype=np.float64) -> None:
+        """
+        :param matrix: Квадратная матрица: массив NumPy или numpy.memmap; не изменяется.
+        :param path: Файл для хранения множителей L и U.
+        :param memory_budget: Допустимый объём памяти под буферы панелей, байт.
+        :param dtype: Тип элементов разложения.
+        """
+        n = matrix.shape[0]
+        if matrix.ndim != 2 or matrix.shape[1] != n:
+            raise ValueError("Матрица системы должна быть квадратной.")
+        itemsize = np.dtype(dtype).itemsize
+        # Текущая панель, одна из предыдущих панелей L и произведение L21 U12
+        panel_width = max(1, min(n, memory_budget // (3 * n * itemsize)))
+        buffers = np.empty((3, n * panel_width), dtype=dtype)
+
+        factors = np.memmap(path, dtype=dtype, mode='w+', shape=(n, n), order='F')
+        ipiv = np.arange(n)
+        self.n, self.path, self.dtype = n, path, np.dtype(dtype)
+        self.panel_width = panel_width
+        self.factors = factors
+
+        panels = [(start, min(start + panel_width, n)) for start in range(0, n, panel_width)]
+        # perm - композиция всех найденных перестановок: строки исходной матрицы в текущем порядке
+        perm = np.arange(n)
+        for k, (start, end) in enumerate(panels):
+            width = end - start
+            # Буферы хранятся по столбцам, как и файл множителей
+            panel, product = (buffer[:n * width].reshape(width, n).T for buffer in (buffers[0], buffers[2]))
+            # Чтение с перестановкой строк сразу в буфер, без промежуточных копий
+            _gather_rows(matrix[:, start:end], perm, panel)
+
+            # Применение всех ранее разложенных панелей. Панель j хранится в порядке строк на момент
+            # своего разложения; rows - перестановки ipiv[j_end:start], найденные после него
+            for j, (j_start, j_end) in enumerate(panels[:k]):
+                if j == 0:
+                    rows = _swap_permutation(ipiv, 0, j_end, n, inverse=True)[perm]
+                else:
+                    rows = _swap_permutation(ipiv, j_start, j_end, n, inverse=True)[rows]
+                l_panel = buffers[1, :n * (j_end - j_start)].reshape(j_end - j_start, n).T
+                _gather_rows(factors[:, j_start:j_end], rows, l_panel)
+                l11 = np.tril(l_panel[j_start:j_end], -1) + np.eye(j_end - j_start, dtype=dtype)
+                panel[j_start:j_end] = np.linalg.solve(l11, panel[j_start:j_end])
+                update = product[j_end:]
+                np.matmul(l_panel[j_end:], panel[j_start:j_end], out=update)
+                panel[j_end:] -= update
+
+            self._factor_panel(panel, ipiv, start, end, product)
+            factors[:, start:end] = panel
+            perm = perm[_swap_permutation(ipiv, start, end, n)]
+
+        # Приведение строк ранних панелей L к итоговому порядку
+        for j, (start, end) in enumerate(panels[:-1]):
+            if j == 0:
+                rows = _swap_permutation(ipiv, 0, end, n, inverse=True)[perm]
+            else:
+                rows = _swap_permutation(ipiv, start, end, n, inverse=True)[rows]
+            l_panel = buffers[1, :n * (end - start)].reshape(end - start, n).T
+            _gather_rows(factors[:, start:end], rows, l_panel)
+            factors[:, start:end] = l_panel
+        factors.flush()
+
+        self.perm = perm
+        self.panels = panels
+
+    @staticmethod
+    def _factor_panel(panel: np.ndarray, ipiv: np.ndarray, start: int, end: int, work: np.ndarray,
+                      block_size: int = 64) -> None:
+        """
+        Разложение панели в памяти; внутри панели - блоками по block_size столбцов,
+        чтобы основная работа выполнялась матричным умножением.
+        Промежуточные произведения записываются в work (массив той же формы, что и panel).
+        """
+        for b_start in range(start, end, block_size):
+            b_end = min(b_start + block_size, end)
+            c0, c1 = b_start - start, b_end - start
+            for i in range(b_start, b_end):
+                c = i - start
+                # Поиск максимального элемента для избежания вырождения
+                p = i + int(np.argmax(np.abs(panel[i:, c])))
+                if panel[p, c] == 0:
+                    raise ZeroDivisionError("Матрица системы вырождена, решение не найдено.")
+                ipiv[i] = p
+                if p != i:
+                    panel[[i, p]] = panel[[p, i]]
+                panel[i + 1:, c] /= panel[i, c]
+                outer = work[i + 1:, c + 1:c1]
+                np.multiply(panel[i + 1:, c, None], panel[i, None, c + 1:c1], out=outer)
+                panel[i + 1:, c + 1:c1] -= outer
+
+            if b_end < end:
+                l11 = np.tril(panel[b_start:b_end, c0:c1], -1) + np.eye(c1 - c0, dtype=panel.dtype)
+                panel[b_start:b_end, c1:] = np.linalg.solve(l11, panel[b_start:b_end, c1:])
+                update = work[b_end:, c1:]
+                np.matmul(panel[b_end:, c0:c1], panel[b_start:b_end, c1:], out=update)
+                panel[b_end:, c1:] -= update
+
+    def solve(self, b) -> np.ndarray:
+        """Решение A x = b; панели множителей читаются с диска по одной."""
+        x = np.asarray(b, dtype=float)[self.perm].copy()
+        factors = self.factors
+
+        # Прямой ход: L y = P b
+        for start, end in self.panels:
+            panel = np.array(factors[start:, start:end], dtype=float)
+            width = end - start
+            l11 = np.tril(panel[:width], -1) + np.eye(width)
+            x[start:end] = np.linalg.solve(l11, x[start:end])
+            x[end:] -= panel[width:] @ x[start:end]
+
+        # Обратный ход: U x = y
+        for start, end in reversed(self.panels):
+            panel = np.array(factors[:end, start:end], dtype=float)
+            x[start:end] = np.linalg.solve(np.triu(panel[start:end]), x[start:end])
+            x[:start] -= panel[:start] @ x[start:end]
+
+        return x
+
+
+def open_matrix(path: str, n: int, dtype=np.float64) -> np.memmap:
+    """Отображение в память файла с матрицей n x n, записанной по строкам без заголовка."""
+    return np.memmap(path, dtype=dtype, mode='r', shape=(n, n))
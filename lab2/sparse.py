@@ -0,0 +1,249 @@
+from collections import deque
+
+import numpy as np
+
+
+class SparseMatrix:
+    """
+    Разреженная матрица в формате CSR: для строки i ненулевые значения data[indptr[i]:indptr[i + 1]]
+    стоят в столбцах indices[indptr[i]:indptr[i + 1]]. Память пропорциональна числу ненулевых элементов.
+    """
+
+    def __init__(self, data, indices, indptr, shape: tuple[int, int]) -> None:
+        self.data = np.asarray(data, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.shape = shape
+        self._rows = None
+
+    @classmethod
+    def from_coo(cls, rows, cols, values, shape: tuple[int, int]) -> 'SparseMatrix':
+        """Построение из троек (строка, столбец, значение); повторяющиеся элементы складываются."""
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        values = np.asarray(values, dtype=float)
+        if rows.size and (rows.min() < 0 or rows.max() >= shape[0] or cols.min() < 0 or cols.max() >= shape[1]):
+            raise ValueError("Индексы элементов выходят за пределы матрицы.")
+
+        order = np.lexsort((cols, rows))
+        rows, cols, values = rows[order], cols[order], values[order]
+        if rows.size:
+            # Суммирование повторяющихся элементов
+            first = np.ones(rows.size, dtype=bool)
+            first[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+            starts = np.flatnonzero(first)
+            values = np.add.reduceat(values, starts)
+            rows, cols = rows[starts], cols[starts]
+
+        indptr = np.zeros(shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=shape[0]), out=indptr[1:])
+        return cls(values, cols, indptr, shape)
+
+    @classmethod
+    def from_dense(cls, a) -> 'SparseMatrix':
+        """Построение из плотной матрицы (например, результата _input)."""
+        a = np.asarray(a, dtype=float)
+        rows, cols = np.nonzero(a)
+        return cls.from_coo(rows, cols, a[rows, cols], a.shape)
+
+    @classmethod
+    def from_matrix_market(cls, path: str) -> 'SparseMatrix':
+        """
+        Чтение файла в координатном формате Matrix Market:
+        заголовок '%%MatrixMarket matrix coordinate <тип> <симметрия>', строки комментариев '%',
+        затем 'строк столбцов ненулевых' и тройки 'i j значение' с нумерацией с единицы.
+        Поддерживаются типы real, integer, pattern (значения равны 1) и симметрии general,
+        symmetric, skew-symmetric (в файле хранится нижний треугольник, верхний восстанавливается).
+        """
+        with open(path) as file:
+            banner = file.readline().lower().split()
+            if len(banner) != 5 or banner[0] != '%%matrixmarket' or banner[1] != 'matrix':
+                raise ValueError("Файл не является матрицей в формате Matrix Market.")
+            storage, field, symmetry = banner[2:]
+            if storage != 'coordinate':
+                raise ValueError(f"Формат хранения '{storage}' не поддерживается, ожидается 'coordinate'.")
+            if field not in ('real', 'integer', 'pattern'):
+                raise ValueError(f"Тип элементов '{field}' не поддерживается.")
+            if symmetry not in ('general', 'symmetric', 'skew-symmetric'):
+                raise ValueError(f"Вид симметрии '{symmetry}' не поддерживается.")
+
+            lines = (line for line in file if not line.startswith('%') and line.strip())
+            n_rows, n_cols, nnz = map(int, next(lines).split())
+            columns = 2 if field == 'pattern' else 3
+            triples = np.loadtxt(lines, ndmin=2) if nnz else np.empty((0, columns))
+        if triples.shape != (nnz, columns):
+            raise ValueError("Число элементов в файле не совпадает с заголовком.")
+
+        rows = triples[:, 0].astype(np.int64) - 1
+        cols = triples[:, 1].astype(np.int64) - 1
+        values = np.ones(nnz) if field == 'pattern' else triples[:, 2]
+        if symmetry != 'general':
+            # Отражение внедиагональных элементов: a[j, i] = a[i, j] или -a[i, j]
+            off_diagonal = rows != cols
+            sign = 1.0 if symmetry == 'symmetric' else -1.0
+            rows, cols = np.concatenate([rows, cols[off_diagonal]]), np.concatenate([cols, rows[off_diagonal]])
+            values = np.concatenate([values, sign * values[off_diagonal]])
+        return cls.from_coo(rows, cols, values, (n_rows, n_cols))
+
+    @property
+    def nnz(self) -> int:
+        return self.data.size
+
+    def row_indices(self) -> np.ndarray:
+        """Номер строки для каждого хранимого элемента (формат COO)."""
+        if self._rows is None:
+            self._rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        return self._rows
+
+    def to_dense(self) -> np.ndarray:
+        a = np.zeros(self.shape)
+        a[self.row_indices(), self.indices] = self.data
+        return a
+
+    def __matmul__(self, x) -> np.ndarray:
+        """Умножение на вектор или матрицу за O(nnz)."""
+        x = np.asarray(x, dtype=float)
+        if x.ndim == 1:
+            return np.bincount(self.row_indices(), weights=self.data * x[self.indices], minlength=self.shape[0])
+        products = self.data.reshape((-1,) + (1,) * (x.ndim - 1)) * x[self.indices]
+        result = np.zeros((self.shape[0],) + x.shape[1:])
+        np.add.at(result, self.row_indices(), products)
+        return result
+
+    def diagonal(self) -> np.ndarray:
+        rows = self.row_indices()
+        on_diagonal = rows == self.indices
+        diagonal = np.zeros(min(self.shape))
+        diagonal[rows[on_diagonal]] = self.data[on_diagonal]
+        return diagonal
+
+    def permute(self, perm) -> 'SparseMatrix':
+        """Симметричная перестановка P A P^T: новая строка/столбец k - это старые perm[k]."""
+        inverse = np.empty_like(perm)
+        inverse[perm] = np.arange(perm.size)
+        return SparseMatrix.from_coo(inverse[self.row_indices()], inverse[self.indices], self.data, self.shape)
+
+
+def reverse_cuthill_mckee(matrix: SparseMatrix) -> np.ndarray:
+    """
+    Упорядочение Катхилла-Макки в обратном порядке для симметризованного шаблона A + A^T.
+    Уменьшает ширину ленты матрицы и, следовательно, заполнение при LU-разложении.
+    :return: Перестановка perm: новая вершина k - это старая perm[k].
+    """
+    n = matrix.shape[0]
+    rows, cols = matrix.row_indices(), matrix.indices
+    off_diagonal = rows != cols
+    pattern = SparseMatrix.from_coo(np.concatenate([rows[off_diagonal], cols[off_diagonal]]),
+                                    np.concatenate([cols[off_diagonal], rows[off_diagonal]]),
+                                    np.ones(2 * np.count_nonzero(off_diagonal)), (n, n))
+    degree = np.diff(pattern.indptr)
+    indptr, indices = pattern.indptr, pattern.indices
+
+    order = []
+    visited = np.zeros(n, dtype=bool)
+    # Каждая компонента связности обходится в ширину, начиная с вершины наименьшей степени
+    for start in np.argsort(degree, kind='stable'):
+        if visited[start]:
+            continue
+        visited[start] = True
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            neighbours = indices[indptr[node]:indptr[node + 1]]
+            neighbours = neighbours[~visited[neighbours]]
+            if neighbours.size:
+                neighbours = neighbours[np.argsort(degree[neighbours], kind='stable')]
+                visited[neighbours] = True
+                queue.extend(neighbours.tolist())
+
+    return np.array(order[::-1], dtype=np.int64)
+
+
+class SparseLU:
+    """
+    Прямой решатель для разреженных систем.
+    Матрица переупорядочивается методом RCM, после чего раскладывается ленточным
+    LU-разложением с выбором главного элемента по столбцу. Заполнение возникает только
+    внутри ленты, поэтому память - O(n * (2 kl + ku + 1)), а не O(n^2), где kl и ku - наибольшие
+    нижняя и верхняя ширины ленты после переупорядочения.
+    Память не пропорциональна числу ненулевых элементов: ширина ленты определяется худшей строкой.
+    Для двумерной сетки m x m ширина ленты порядка m, и хранится O(m^3) элементов
+    (для 10^6 неизвестных - около 3 * 10^9). Решатель подходит для матриц с узкой лентой;
+    для больших двумерных и трёхмерных задач следует использовать итерационные методы (iterative.py).
+    """
+
+    def __init__(self, matrix: SparseMatrix, reorder: bool = True) -> None:
+        n = matrix.shape[0]
+        if matrix.shape[0] != matrix.shape[1]:
+            raise ValueError("Матрица системы должна быть квадратной.")
+        self.n = n
+        self.perm = reverse_cuthill_mckee(matrix) if reorder else np.arange(n)
+        matrix = matrix.permute(self.perm) if reorder else matrix
+
+        rows, cols = matrix.row_indices(), matrix.indices
+        kl = int(np.max(rows - cols, initial=0))
+        ku = int(np.max(cols - rows, initial=0))
+        # При перестановках строк верхняя ширина ленты может вырасти на kl
+        ku2 = ku + kl
+        self.kl, self.ku2 = kl, ku2
+
+        # Ленточное хранение по столбцам: A[i, j] = band[i - j + ku2, j]
+        band = np.zeros((2 * kl + ku + 1, n))
+        band[rows - cols + ku2, cols] = matrix.data
+        pivots = np.arange(n)
+
+        for k in range(n):
+            last_row = min(k + kl, n - 1)
+            last_col = min(k + ku2, n - 1)
+            column = band[ku2:ku2 + last_row - k + 1, k]
+            p = k + int(np.argmax(np.abs(column)))
+            if band[p - k + ku2, k] == 0:
+                raise ZeroDivisionError("Матрица системы вырождена, решение не найдено.")
+            pivots[k] = p
+
+            cols_k = np.arange(k, last_col + 1)
+            if p != k:
+                row_k, row_p = k - cols_k + ku2, p - cols_k + ku2
+                band[row_k, cols_k], band[row_p, cols_k] = band[row_p, cols_k], band[row_k, cols_k].copy()
+
+            m = last_row - k
+            if m == 0:
+                continue
+            band[ku2 + 1:ku2 + 1 + m, k] /= band[ku2, k]
+            if last_col > k:
+                i = np.arange(k + 1, last_row + 1)[:, None]
+                j = cols_k[None, 1:]
+                band[i - j + ku2, j] -= band[ku2 + 1:ku2 + 1 + m, k][:, None] * band[k - j + ku2, j]
+
+        self.band = band
+        self.pivots = pivots
+
+    @property
+    def storage(self) -> int:
+        """Число хранимых элементов ленты множителей L и U, включая нули внутри ленты."""
+        return self.band.size
+
+    def solve(self, b) -> np.ndarray:
+        """Решение A x = b для вектора b."""
+        n, kl, ku2, band = self.n, self.kl, self.ku2, self.band
+        x = np.asarray(b, dtype=float)[self.perm].copy()
+
+        # Прямой ход: перестановки и L
+        for k in range(n):
+            p = self.pivots[k]
+            if p != k:
+                x[k], x[p] = x[p], x[k]
+            m = min(kl, n - 1 - k)
+            if m:
+                x[k + 1:k + 1 + m] -= band[ku2 + 1:ku2 + 1 + m, k] * x[k]
+
+        # Обратный ход: U
+        for k in range(n - 1, -1, -1):
+            last_col = min(k + ku2, n - 1)
+            j = np.arange(k + 1, last_col + 1)
+            x[k] = (x[k] - band[k - j + ku2, j] @ x[j]) / band[ku2, k]
+
+        result = np.empty(n)
+        result[self.perm] = x
+        return result
@@ -0,0 +1,109 @@
+import numpy as np
+
+from factorization import TridiagonalFactorization
+
+
+def solve_cyclic_tridiagonal(a, b, c, d) -> np.ndarray:
+    """
+    Циклическая трёхдиагональная система (периодические граничные условия):
+    a[0] - коэффициент при x[n-1] в первом уравнении, c[n-1] - при x[0] в последнем.
+    Угловые элементы выносятся в поправку ранга 1 (формула Шермана-Моррисона), после чего
+    обычная трёхдиагональная матрица раскладывается один раз и решается сразу для двух правых частей.
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.array(b, dtype=float)
+    c = np.asarray(c, dtype=float)
+    d = np.asarray(d, dtype=float)
+    n = d.size
+    if n < 3:
+        raise ValueError("Циклическая система должна содержать не менее трёх уравнений.")
+
+    alpha, beta = c[n - 1], a[0]
+    gamma = -b[0] if b[0] != 0 else 1.0
+    b[0] -= gamma
+    b[n - 1] -= alpha * beta / gamma
+
+    u = np.zeros(n)
+    u[0], u[n - 1] = gamma, alpha
+    factorization = TridiagonalFactorization(np.r_[0.0, a[1:]], b, np.r_[c[:-1], 0.0])
+    y, z = factorization.solve(np.column_stack([d, u])).T
+
+    factor = (y[0] + beta * y[n - 1] / gamma) / (1 + z[0] + beta * z[n - 1] / gamma)
+    return y - factor * z
+
+
+def solve_block_tridiagonal(A, B, C, D) -> np.ndarray:
+    """
+    Блочная прогонка для системы A[i] X[i-1] + B[i] X[i] + C[i] X[i+1] = D[i]
+    с плотными блоками k x k (например, для связанных многокомпонентных уравнений).
+    Время O(n k^3), память O(n k^2).
+    :param A: Поддиагональные блоки формы (n, k, k) (A[0] не используется).
+    :param B: Диагональные блоки формы (n, k, k).
+    :param C: Наддиагональные блоки формы (n, k, k) (C[n-1] не используется).
+    :param D: Правые части формы (n, k).
+    :return: Решение формы (n, k).
+    """
+    A = np.asarray(A, dtype=float)
+    B = np.asarray(B, dtype=float)
+    C = np.asarray(C, dtype=float)
+    D = np.asarray(D, dtype=float)
+    n, k = D.shape
+    if A.shape != (n, k, k) or B.shape != (n, k, k) or C.shape != (n, k, k):
+        raise ValueError("Блоки должны иметь форму (n, k, k), правая часть - (n, k).")
+
+    # Прямой ход: C'[i] = M^-1 C[i], D'[i] = M^-1 (D[i] - A[i] D'[i-1]), M = B[i] - A[i] C'[i-1]
+    C_ = np.empty_like(C)
+    D_ = np.empty_like(D)
+    M = B[0]
+    for i in range(n):
+        if i > 0:
+            M = B[i] - A[i] @ C_[i - 1]
+        rhs = np.column_stack([C[i], D[i] - (A[i] @ D_[i - 1] if i > 0 else 0)])
+        try:
+            solution = np.linalg.solve(M, rhs)
+        except np.linalg.LinAlgError:
+            raise ZeroDivisionError("Обнаружен вырожденный диагональный блок, система неразрешима.") from None
+        C_[i], D_[i] = solution[:, :k], solution[:, k]
+
+    # Обратный ход
+    X = np.empty_like(D)
+    X[n - 1] = D_[n - 1]
+    for i in range(n - 2, -1, -1):
+        X[i] = D_[i] - C_[i] @ X[i + 1]
+    return X
+
+
+def solve_banded(kl: int, ku: int, bands, d) -> np.ndarray:
+    """
+    Ленточная система с kl поддиагоналями и ku наддиагоналями (пятидиагональная: kl = ku = 2).
+    Матрица хранится компактно по диагоналям: A[i, j] = bands[ku + i - j, j], форма (kl + ku + 1, n).
+    Исключение Гаусса без перестановок, как и в методе прогонки, - для матриц
+    с диагональным преобладанием. Время O(n kl ku), память O(n (kl + ku)).
+    """
+    band = np.array(bands, dtype=float)
+    x = np.array(d, dtype=float)
+    n = x.size
+    if band.shape != (kl + ku + 1, n):
+        raise ValueError("Массив диагоналей должен иметь форму (kl + ku + 1, n).")
+
+    # Прямой ход
+    for k in range(n):
+        pivot = band[ku, k]
+        if pivot == 0:
+            raise ZeroDivisionError("Обнаружена нулевая диагональ, система неразрешима.")
+        m = min(kl, n - 1 - k)
+        if m == 0:
+            continue
+        factors = band[ku + 1:ku + 1 + m, k] / pivot
+        x[k + 1:k + 1 + m] -= factors * x[k]
+        last = min(k + ku, n - 1)
+        if last > k:
+            i = np.arange(k + 1, k + 1 + m)[:, None]
+            j = np.arange(k + 1, last + 1)[None, :]
+            band[ku + i - j, j] -= factors[:, None] * band[ku + k - j, j]
+
+    # Обратный ход
+    for k in range(n - 1, -1, -1):
+        j = np.arange(k + 1, min(k + ku, n - 1) + 1)
+        x[k] = (x[k] - band[ku + k - j, j] @ x[j]) / band[ku, k]
+    return x
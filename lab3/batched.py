@@ -0,0 +1,77 @@
+import numpy as np
+
+from main import print_result_table
+
+
+def tridiagonal_workspace(m: int, n: int) -> np.ndarray:
+    """
+    Рабочий массив для batched_tridiagonal: прогоночные коэффициенты U и V
+    (по n строк длины m) и две вспомогательные строки.
+    """
+    return np.empty((2 * n + 2, m))
+
+
+def batched_tridiagonal(a, b, c, d, out: np.ndarray | None = None, workspace: np.ndarray | None = None,
+                        verbose: bool = False) -> np.ndarray:
+    """
+    Метод прогонки сразу для m независимых трёхдиагональных систем.
+    Прямой и обратный ход выполняются векторно по всем системам, то есть по столбцам a[:, i].
+    Массивы не копируются: при переданных out и workspace и входных массивах float64
+    функция не выделяет память под массивы, что важно при многократных вызовах на каждом шаге по времени.
+    Подходит любой порядок хранения; массивы в порядке F (order='F' или транспонированные
+    массивы (n, m) в порядке C) быстрее примерно в 2-3 раза, так как их столбцы непрерывны в памяти.
+    :param a: Поддиагонали, массив формы (m, n) (a[:, 0] не используется).
+    :param b: Главные диагонали, (m, n).
+    :param c: Наддиагонали, (m, n) (c[:, n - 1] не используется).
+    :param d: Правые части, (m, n).
+    :param out: Массив (m, n) для решения; по умолчанию - в том же порядке хранения, что и d.
+    :param workspace: Рабочий массив из tridiagonal_workspace(m, n).
+    :param verbose: Вывести таблицы коэффициентов прогонки для каждой системы.
+    :return: Решения формы (m, n).
+    """
+    a, b, c, d = (np.asarray(array, dtype=float) for array in (a, b, c, d))
+    m, n = d.shape
+    if a.shape != (m, n) or b.shape != (m, n) or c.shape != (m, n):
+        raise ValueError("Размеры массивов a, b, c, d должны совпадать.")
+    if out is None:
+        out = np.empty((m, n), order='F' if d.flags.f_contiguous and not d.flags.c_contiguous else 'C')
+    elif out.shape != (m, n):
+        raise ValueError("Массив out должен иметь форму (m, n).")
+    if workspace is None:
+        workspace = tridiagonal_workspace(m, n)
+    if workspace.shape != (2 * n + 2, m):
+        raise ValueError("Рабочий массив должен иметь форму (2n + 2, m).")
+
+    U = workspace[:n]
+    V = workspace[n:2 * n]
+    denominator = workspace[2 * n]
+    tmp = workspace[2 * n + 1]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Прямой ход
+        np.divide(c[:, 0], b[:, 0], out=U[0])
+        np.negative(U[0], out=U[0])
+        np.divide(d[:, 0], b[:, 0], out=V[0])
+        for i in range(1, n):
+            np.multiply(a[:, i], U[i - 1], out=denominator)
+            np.add(denominator, b[:, i], out=denominator)
+            np.divide(c[:, i], denominator, out=U[i])
+            np.negative(U[i], out=U[i])
+            np.multiply(a[:, i], V[i - 1], out=tmp)
+            np.subtract(d[:, i], tmp, out=V[i])
+            np.divide(V[i], denominator, out=V[i])
+
+        # Обратный ход
+        out[:, n - 1] = V[n - 1]
+        for i in range(n - 2, -1, -1):
+            np.multiply(U[i], out[:, i + 1], out=out[:, i])
+            np.add(out[:, i], V[i], out=out[:, i])
+
+    if not np.isfinite(out.sum()):
+        raise ZeroDivisionError("Обнаружена нулевая диагональ, система неразрешима.")
+
+    if verbose:
+        for k in range(m):
+            print_result_table(n, U[:, k], V[:, k], out[k])
+
+    return out
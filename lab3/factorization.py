@@ -0,0 +1,82 @@
+import numpy as np
+
+
+class TridiagonalFactorization:
+    """
+    Прогонка с однократным вычислением коэффициентов для неизменной матрицы.
+    При создании сохраняются U[i] = -c[i] / den[i], обратные знаменатели r[i] = 1 / den[i]
+    и произведения a[i] * r[i], где den[i] = a[i] * U[i - 1] + b[i]. Каждое решение
+    требует только одного умножения со сложением на прямом и обратном ходе, без делений.
+    """
+
+    def __init__(self, a, b, c) -> None:
+        a = np.asarray(a, dtype=float)
+        b = np.asarray(b, dtype=float)
+        c = np.asarray(c, dtype=float)
+        n = b.size
+        if a.size != n or c.size != n:
+            raise ValueError("Размеры векторов a, b, c должны совпадать.")
+
+        U = [0.0] * n
+        r = [0.0] * n
+        if b[0] == 0:
+            raise ZeroDivisionError("Обнаружена нулевая диагональ, система неразрешима.")
+        r[0] = 1 / b[0]
+        U[0] = -c[0] * r[0]
+        for i in range(1, n):
+            denominator = a[i] * U[i - 1] + b[i]
+            if denominator == 0:
+                raise ZeroDivisionError("Обнаружена нулевая диагональ, система неразрешима.")
+            r[i] = 1 / denominator
+            U[i] = -c[i] * r[i]
+
+        self.n = n
+        self.U = np.array(U)
+        self.r = np.array(r)
+        self.ar = a * self.r
+        self.ar[0] = 0.0
+        # Списки для скалярного цикла: элементы списка читаются быстрее элементов массива
+        self._U = self.U.tolist()
+        self._r = self.r.tolist()
+        self._ar = self.ar.tolist()
+
+    def solve(self, d) -> np.ndarray:
+        """
+        Решение системы для правой части d формы (n,) или сразу для многих правых частей формы (n, k).
+        """
+        if isinstance(d, np.ndarray) and d.ndim == 1:
+            d = d.tolist()
+        if isinstance(d, (list, tuple)) and not (d and np.ndim(d[0])):
+            return self._solve_vector(d)
+
+        d = np.asarray(d, dtype=float)
+        if d.shape[0] != self.n:
+            raise ValueError("Размер правой части не совпадает с размером матрицы.")
+        n = self.n
+        # V[i] = d[i] r[i] - a[i] r[i] V[i - 1]
+        V = d * self.r.reshape((-1,) + (1,) * (d.ndim - 1))
+        U, ar = self.U, self.ar
+        for i in range(1, n):
+            V[i] -= ar[i] * V[i - 1]
+        x = V
+        for i in range(n - 2, -1, -1):
+            x[i] += U[i] * x[i + 1]
+        return x
+
+    def _solve_vector(self, d: list[float]) -> np.ndarray:
+        # Скалярная прогонка по спискам: предыдущее значение хранится в локальной переменной
+        if len(d) != self.n:
+            raise ValueError("Размер правой части не совпадает с размером матрицы.")
+        V = []
+        v = 0.0
+        for d_i, r_i, ar_i in zip(d, self._r, self._ar):
+            v = d_i * r_i - ar_i * v
+            V.append(v)
+        # U[n - 1] умножается на x = 0, поэтому x[n - 1] = V[n - 1]
+        x = []
+        x_i = 0.0
+        for v_i, u_i in zip(reversed(V), reversed(self._U)):
+            x_i = v_i + u_i * x_i
+            x.append(x_i)
+        x.reverse()
+        return np.array(x)
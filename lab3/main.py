@@ -41,7 +41,8 @@ def check(x, a, b, c, d):
     return r
 
 
-def solve_tridiagonal(a: list[float], b: list[float], c: list[float], d: list[float]) -> list[float]:
+def solve_tridiagonal(a: list[float], b: list[float], c: list[float], d: list[float],
+                      verbose: bool = False) -> list[float]:
     n = len(d)
     if len(a) != n or len(b) != n or len(c) != n:
         raise ValueError("Размеры векторов a, b, c, d должны совпадать.")
@@ -68,7 +69,8 @@ def solve_tridiagonal(a: list[float], b: list[float], c: list[float], d: list[fl
     for i in range(n - 2, -1, -1):
         x[i] = U[i] * x[i + 1] + V[i]
 
-    print_result_table(n, U, V, x)
+    if verbose:
+        print_result_table(n, U, V, x)
 
     return x
 
@@ -129,7 +131,7 @@ def test():
     d = [2.3, 4, 3.5, 1.4]  # правая часть
 
     print_init_table(len(d), a, b, c, d)
-    solution = solve_tridiagonal(a, b, c, d)
+    solution = solve_tridiagonal(a, b, c, d, verbose=True)
     check(solution, a, b, c, d)
 
     # print(717126 / 314285)
@@ -140,7 +142,7 @@ def test():
 
 def main():
     args = _input()
-    solution = solve_tridiagonal(*args)
+    solution = solve_tridiagonal(*args, verbose=True)
     check(solution, *args)
 
 
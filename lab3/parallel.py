@@ -0,0 +1,157 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+def cyclic_reduction(a, b, c, d) -> np.ndarray:
+    """
+    Метод циклической редукции для трёхдиагональной системы.
+    На каждом уровне из уравнений с нечётными номерами исключаются соседние неизвестные,
+    получается система вдвое меньшего размера; все операции уровня выполняются векторно.
+    :param d: Правая часть формы (n,) или несколько правых частей формы (n, k).
+    """
+    a = np.array(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    c = np.array(c, dtype=float)
+    d = np.asarray(d, dtype=float)
+    n = b.size
+    a[0] = 0
+    c[n - 1] = 0
+    # Делители уровня - диагональ чётных уравнений; нечётные проверяются на следующем уровне
+    even = np.arange(0, n, 2)
+    if np.any(b[even] == 0):
+        raise ZeroDivisionError("Обнаружена нулевая диагональ, система неразрешима.")
+    if n == 1:
+        return d / b[0]
+
+    shape = (-1,) + (1,) * (d.ndim - 1)
+    odd = np.arange(1, n, 2)
+    has_next = odd + 1 < n
+    next_ = np.where(has_next, odd + 1, 0)
+
+    alpha = -a[odd] / b[odd - 1]
+    gamma = np.where(has_next, -c[odd] / b[next_], 0.0)
+    a_next = np.where(has_next, a[next_], 0.0)
+    c_next = np.where(has_next, c[next_], 0.0)
+
+    reduced_a = alpha * a[odd - 1]
+    reduced_b = b[odd] + alpha * c[odd - 1] + gamma * a_next
+    reduced_c = gamma * c_next
+    reduced_d = d[odd] + alpha.reshape(shape) * d[odd - 1] + gamma.reshape(shape) * np.where(
+        has_next.reshape(shape), d[next_], 0.0)
+
+    x = np.empty_like(d)
+    x[odd] = cyclic_reduction(reduced_a, reduced_b, reduced_c, reduced_d)
+
+    # Обратная подстановка для чётных неизвестных
+    left = np.zeros_like(d[even])
+    right = np.zeros_like(d[even])
+    left[1:] = x[even[1:] - 1]
+    has_right = even + 1 < n
+    right[has_right] = x[even[has_right] + 1]
+    x[even] = (d[even] - a[even].reshape(shape) * left - c[even].reshape(shape) * right) / b[even].reshape(shape)
+    return x
+
+
+def _attach(names: dict[str, str], n: int) -> tuple[dict, dict]:
+    blocks = {key: shared_memory.SharedMemory(name=name) for key, name in names.items()}
+    arrays = {key: np.ndarray((n,), dtype=np.float64, buffer=block.buf) for key, block in blocks.items()}
+    return blocks, arrays
+
+
+def _solve_chunk(names: dict[str, str], n: int, start: int, end: int) -> tuple[float, ...]:
+    """
+    Решение подсистемы строк [start, end) для правой части и двух «шипов» -
+    столбцов связи с соседними блоками. Результаты записываются в общую память.
+    """
+    blocks, arrays = _attach(names, n)
+    try:
+        a, b, c = arrays['a'][start:end], arrays['b'][start:end], arrays['c'][start:end]
+        rhs = np.zeros((end - start, 3))
+        rhs[:, 0] = arrays['d'][start:end]
+        rhs[0, 1] = a[0]
+        rhs[-1, 2] = c[-1]
+        solution = cyclic_reduction(a, b, c, rhs)
+        arrays['y'][start:end] = solution[:, 0]
+        arrays['v'][start:end] = solution[:, 1]
+        arrays['w'][start:end] = solution[:, 2]
+        return tuple(solution[[0, -1]].T.ravel())
+    finally:
+        for block in blocks.values():
+            block.close()
+
+
+def _finish_chunk(names: dict[str, str], n: int, start: int, end: int, x_left: float, x_right: float) -> None:
+    """Восстановление решения блока: x = y - x_left * v - x_right * w (записывается на место y)."""
+    blocks, arrays = _attach(names, n)
+    try:
+        y = arrays['y'][start:end]
+        y -= x_left * arrays['v'][start:end]
+        y -= x_right * arrays['w'][start:end]
+    finally:
+        for block in blocks.values():
+            block.close()
+
+
+def parallel_tridiagonal(a, b, c, d, workers: int | None = None, chunks: int | None = None) -> np.ndarray:
+    """
+    Параллельный метод разбиения (Ванга / SPIKE) для одной очень длинной трёхдиагональной системы.
+    1. Система делится на блоки, каждый блок решается в отдельном процессе
+       циклической редукцией для правой части и двух столбцов связи с соседями.
+    2. Граничные неизвестные блоков находятся из малой системы размера 2 * chunks.
+    3. Решение внутри блоков восстанавливается параллельно.
+    Данные передаются процессам через общую память, без копирования в каждый процесс.
+    Как и метод прогонки, метод не использует перестановок и рассчитан на
+    матрицы с диагональным преобладанием.
+    """
+    n = len(d)
+    workers = workers or os.cpu_count() or 1
+    chunks = min(chunks or workers, n // 2) or 1
+    if workers == 1 or chunks == 1:
+        return cyclic_reduction(a, b, c, d)
+
+    bounds = np.linspace(0, n, chunks + 1).astype(np.int64)
+    blocks = {key: shared_memory.SharedMemory(create=True, size=n * 8) for key in 'abcdyvw'}
+    try:
+        arrays = {key: np.ndarray((n,), dtype=np.float64, buffer=block.buf) for key, block in blocks.items()}
+        arrays['a'][:] = a
+        arrays['b'][:] = b
+        arrays['c'][:] = c
+        arrays['d'][:] = d
+        names = {key: block.name for key, block in blocks.items()}
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            jobs = [pool.submit(_solve_chunk, names, n, int(start), int(end))
+                    for start, end in zip(bounds[:-1], bounds[1:])]
+            # y, v, w в первой и последней строке каждого блока
+            edges = np.array([job.result() for job in jobs])
+
+            # Малая система для граничных неизвестных [first_0, last_0, first_1, last_1, ...]
+            size = 2 * chunks
+            reduced = np.eye(size)
+            rhs = np.empty(size)
+            for k in range(chunks):
+                y_first, y_last, v_first, v_last, w_first, w_last = edges[k]
+                rhs[2 * k], rhs[2 * k + 1] = y_first, y_last
+                if k > 0:
+                    reduced[2 * k, 2 * k - 1] += v_first
+                    reduced[2 * k + 1, 2 * k - 1] += v_last
+                if k < chunks - 1:
+                    reduced[2 * k, 2 * k + 2] += w_first
+                    reduced[2 * k + 1, 2 * k + 2] += w_last
+            boundary = np.linalg.solve(reduced, rhs)
+
+            jobs = [pool.submit(_finish_chunk, names, n, int(bounds[k]), int(bounds[k + 1]),
+                                boundary[2 * k - 1] if k > 0 else 0.0,
+                                boundary[2 * k + 2] if k < chunks - 1 else 0.0)
+                    for k in range(chunks)]
+            for job in jobs:
+                job.result()
+
+        return arrays['y'].copy()
+    finally:
+        for block in blocks.values():
+            block.close()
+            block.unlink()
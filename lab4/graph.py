@@ -7,53 +7,31 @@ matplotlib.use('TkAgg')
 
 import matplotlib.pyplot as plt
 
+from interpolation import LagrangeInterpolator, NewtonInterpolator
+
 
 def evaluate_lagrange(x_points, y_points, x_eval):
     """
     Вычисляет значение интерполяционного полинома Лагранжа в точке x_eval.
+    Для многократных вычислений по одним узлам используйте LagrangeInterpolator.
     :param x_points: Список узлов интерполяции (x).
     :param y_points: Список значений функции (y).
-    :param x_eval: Точка, в которой вычисляем значение.
+    :param x_eval: Точка или массив точек, в которых вычисляем значение.
     :return: Значение полинома в точке x_eval.
     """
-    n = len(x_points)
-    result = 0
-    for i in range(n):
-        if y_points[i] == 0:
-            continue
-
-        L_i = 1
-        for j in range(n):
-            if i != j:
-                L_i *= (x_eval - x_points[j]) / (x_points[i] - x_points[j])
-        result += y_points[i] * L_i
-    return result
+    return LagrangeInterpolator(x_points, y_points)(x_eval)
 
 
 def evaluate_newton(x_points, y_points, x_eval):
     """
     Вычисляет значение интерполяционного полинома Ньютона в точке x_eval.
+    Для многократных вычислений по одним узлам используйте NewtonInterpolator.
     :param x_points: Список узлов интерполяции (x).
     :param y_points: Список значений функции (y).
-    :param x_eval: Точка, в которой вычисляем значение.
+    :param x_eval: Точка или массив точек, в которых вычисляем значение.
     :return: Значение полинома в точке x_eval.
     """
-    n = len(x_points)
-    divided_diff = [y_points[:]]
-    for level in range(1, n):
-        diffs = []
-        for i in range(n - level):
-            diff = (divided_diff[level - 1][i + 1] - divided_diff[level - 1][i]) / (x_points[i + level] - x_points[i])
-            diffs.append(diff)
-        divided_diff.append(diffs)
-
-    result = divided_diff[0][0]
-    product = 1
-    for level in range(1, n):
-        product *= (x_eval - x_points[level - 1])
-        result += divided_diff[level][0] * product
-
-    return result
+    return NewtonInterpolator(x_points, y_points)(x_eval)
 
 def plot_polynomials(x_points, y_points):
     """
@@ -63,8 +41,8 @@ def plot_polynomials(x_points, y_points):
     """
     x_range = np.linspace(min(x_points) - 1, max(x_points) + 1, 500)
 
-    lagrange_values = [evaluate_lagrange(x_points, y_points, x) for x in x_range]
-    newton_values = [evaluate_newton(x_points, y_points, x) for x in x_range]
+    lagrange_values = LagrangeInterpolator(x_points, y_points)(x_range)
+    newton_values = NewtonInterpolator(x_points, y_points)(x_range)
 
     plt.figure(figsize=(10, 6))
 
@@ -0,0 +1,247 @@
+import numpy as np
+
+# Число пар (точка, узел), обрабатываемых за один проход: ограничивает память промежуточных матриц
+CHUNK_SIZE = 1 << 20
+
+
+class LagrangeInterpolator:
+    """
+    Интерполяционный полином Лагранжа в барицентрической форме:
+    P(x) = sum(w[j] y[j] / (x - x[j])) / sum(w[j] / (x - x[j])), w[j] = 1 / prod(x[j] - x[k]).
+    Веса вычисляются один раз за O(n^2), каждое значение - за O(n),
+    векторизованно по массиву точек. Веса не зависят от y, поэтому значения в узлах можно менять.
+    """
+
+    def __init__(self, x_points, y_points) -> None:
+        x = np.asarray(x_points, dtype=float)
+        y = np.array(y_points, dtype=float)
+        if x.ndim != 1 or x.shape != y.shape:
+            raise ValueError("Списки x и y должны быть одномерными и одинаковой длины.")
+        if np.unique(x).size != x.size:
+            raise ValueError("Все значения x должны быть уникальными.")
+
+        # Разности масштабируются на 4 / (длина отрезка), чтобы произведения
+        # не переполнялись и не исчезали при большом числе узлов; общий множитель сокращается
+        scale = 4 / (x.max() - x.min()) if x.size > 1 else 1.0
+        differences = (x[:, None] - x[None, :]) * scale
+        np.fill_diagonal(differences, 1.0)
+        self.x = x
+        self.y = y
+        self.weights = 1 / np.prod(differences, axis=1)
+
+    def __len__(self) -> int:
+        return self.x.size
+
+    def set_value(self, index: int, value: float) -> None:
+        """
+        Заменяет значение функции в узле без пересчёта весов.
+        :param index: Номер узла.
+        :param value: Новое значение y.
+        """
+        self.y[index] = value
+
+    def __call__(self, x_eval):
+        """
+        Вычисляет значение полинома в точке или массиве точек.
+        :param x_eval: Точка или массив точек любой формы.
+        :return: Число для скалярного аргумента, иначе массив той же формы.
+        """
+        points = np.asarray(x_eval, dtype=float)
+        flat = points.ravel()
+        result = np.empty(flat.size)
+        step = max(1, CHUNK_SIZE // self.x.size)
+        for start in range(0, flat.size, step):
+            result[start:start + step] = self._evaluate(flat[start:start + step])
+        result = result.reshape(points.shape)
+        return float(result) if result.ndim == 0 else result
+
+    def _evaluate(self, points: np.ndarray) -> np.ndarray:
+        inverse = np.subtract.outer(points, self.x)
+        exact = inverse == 0
+        inverse[exact] = 1.0
+        np.reciprocal(inverse, out=inverse)
+        # Числитель и знаменатель - два умножения матрицы на вектор
+        result = (inverse @ (self.weights * self.y)) / (inverse @ self.weights)
+        # Точки, совпавшие с узлом, получают значение в узле
+        rows, nodes = np.nonzero(exact)
+        result[rows] = self.y[nodes]
+        return result
+
+
+class NewtonInterpolator:
+    """
+    Интерполяционный полином Ньютона с однократно построенной таблицей разделённых разностей:
+    P(x) = c[0] + c[1] (x - x[0]) + ... + c[n-1] (x - x[0]) ... (x - x[n-2]).
+    Хранятся коэффициенты c (верхняя диагональ таблицы) и нижняя диагональ
+    f[x[n-1-k], ..., x[n-1]], поэтому новый узел добавляется за O(n).
+    """
+
+    def __init__(self, x_points, y_points) -> None:
+        x = np.asarray(x_points, dtype=float)
+        table = np.array(y_points, dtype=float)
+        if x.ndim != 1 or x.shape != table.shape:
+            raise ValueError("Списки x и y должны быть одномерными и одинаковой длины.")
+        if np.unique(x).size != x.size:
+            raise ValueError("Все значения x должны быть уникальными.")
+
+        n = x.size
+        coefficients = np.empty(n)
+        last = np.empty(n)
+        if n:
+            coefficients[0], last[0] = table[0], table[-1]
+        for level in range(1, n):
+            table = (table[1:] - table[:-1]) / (x[level:] - x[:-level])
+            coefficients[level], last[level] = table[0], table[-1]
+
+        self.x = x
+        self.coefficients = coefficients
+        self._last = last
+
+    def __len__(self) -> int:
+        return self.x.size
+
+    def add_point(self, x_new: float, y_new: float) -> None:
+        """
+        Добавляет узел, достраивая только нижнюю диагональ таблицы разностей, за O(n).
+        :param x_new: Новый узел.
+        :param y_new: Значение функции в нём.
+        """
+        if np.any(self.x == x_new):
+            raise ValueError(f"Повторяющееся значение x: {x_new}. Все значения x должны быть уникальными.")
+        n = self.x.size
+        last = np.empty(n + 1)
+        last[0] = y_new
+        # f[x[n-k], ..., x_new] = (f[x[n-k+1], ..., x_new] - f[x[n-k], ..., x[n-1]]) / (x_new - x[n-k])
+        denominators = (x_new - self.x[::-1]).tolist()
+        previous = self._last.tolist()
+        value = float(y_new)
+        for k in range(1, n + 1):
+            value = (value - previous[k - 1]) / denominators[k - 1]
+            last[k] = value
+
+        self.x = np.append(self.x, x_new)
+        self.coefficients = np.append(self.coefficients, value)
+        self._last = last
+
+    def __call__(self, x_eval):
+        """
+        Вычисляет значение полинома по схеме Горнера для точки или массива точек.
+        :param x_eval: Точка или массив точек любой формы.
+        :return: Число для скалярного аргумента, иначе массив той же формы.
+        """
+        points = np.asarray(x_eval, dtype=float)
+        result = np.zeros_like(points)
+        if self.x.size:
+            result += self.coefficients[-1]
+        for k in range(self.x.size - 2, -1, -1):
+            result *= points - self.x[k]
+            result += self.coefficients[k]
+        return float(result) if result.ndim == 0 else result
+
+
+class ChebyshevInterpolator:
+    """
+    Разложение функции на отрезке [a, b] по многочленам Чебышёва: P(x) = sum(c[k] T_k(t)),
+    t = (2x - a - b) / (b - a). Значение вычисляется векторизованной схемой Кленшоу за O(n).
+    """
+
+    def __init__(self, coefficients, a: float = -1.0, b: float = 1.0) -> None:
+        if not a < b:
+            raise ValueError("Левая граница отрезка должна быть меньше правой.")
+        self.coefficients = np.asarray(coefficients, dtype=float)
+        self.a = float(a)
+        self.b = float(b)
+
+    @staticmethod
+    def points(n: int, a: float = -1.0, b: float = 1.0) -> np.ndarray:
+        """
+        Узлы Чебышёва второго рода (экстремумы T_n), отображённые на [a, b].
+        :param n: Степень; возвращается n + 1 узел от b до a.
+        """
+        t = np.cos(np.pi * np.arange(n + 1) / n)
+        return (a + b) / 2 + (b - a) / 2 * t
+
+    @staticmethod
+    def _coefficients(values: np.ndarray) -> np.ndarray:
+        # ДКП-I через БПФ чётного продолжения длины 2n: O(n log n)
+        n = values.size - 1
+        extended = np.concatenate([values, values[-2:0:-1]])
+        coefficients = np.fft.rfft(extended).real[:n + 1] / n
+        coefficients[0] /= 2
+        coefficients[n] /= 2
+        return coefficients
+
+    @classmethod
+    def adaptive(cls, func, a: float = -1.0, b: float = 1.0, tolerance: float = 1e-13,
+                 max_degree: int = 1 << 16) -> 'ChebyshevInterpolator':
+        """
+        Подбирает наименьшую степень, при которой разложение представляет функцию с заданной точностью.
+        Степень удваивается, пока хвостовые коэффициенты не станут меньше tolerance * max|c|;
+        узлы вложены, поэтому на каждом шаге функция вычисляется только в новых точках.
+        Затем ряд обрезается по последнему значимому коэффициенту. Малый хвост может быть следствием
+        наложения частот, поэтому обрезанный ряд принимается, только если он совпадает с функцией
+        в новых узлах следующей степени - тех, что всё равно вычисляются при её удвоении.
+        :param func: Векторизованная функция одного аргумента.
+        :param a: Левая граница отрезка.
+        :param b: Правая граница отрезка.
+        :param tolerance: Относительная точность.
+        :param max_degree: Наибольшая допустимая степень.
+        :return: Интерполятор минимальной найденной степени.
+        """
+        n = 16
+        values = cls._sample(func, cls.points(n, a, b))
+        while True:
+            coefficients = cls._coefficients(values)
+            threshold = tolerance * max(np.abs(coefficients).max(), np.finfo(float).tiny)
+            candidate = None
+            # Сходимость: несколько последних коэффициентов пренебрежимо малы
+            if np.all(np.abs(coefficients[-max(2, n // 8):]) <= threshold):
+                significant = np.nonzero(np.abs(coefficients) > threshold)[0]
+                degree = significant[-1] if significant.size else 0
+                candidate = cls(coefficients[:degree + 1], a, b)
+            elif 2 * n > max_degree:
+                raise ValueError(f"Не удалось достичь точности {tolerance} при степени не выше {max_degree}.")
+            # Узлы степени 2n с чётными номерами совпадают с узлами степени n
+            midpoints = cls.points(2 * n, a, b)[1::2]
+            new_values = cls._sample(func, midpoints)
+            # Отброшено не больше n коэффициентов, каждый не больше threshold
+            if candidate is not None and np.max(np.abs(candidate(midpoints) - new_values)) <= n * threshold:
+                return candidate
+            if 2 * n > max_degree:
+                raise ValueError(f"Не удалось достичь точности {tolerance} при степени не выше {max_degree}.")
+            refined = np.empty(2 * n + 1)
+            refined[::2] = values
+            refined[1::2] = new_values
+            values = refined
+            n *= 2
+
+    @staticmethod
+    def _sample(func, points: np.ndarray) -> np.ndarray:
+        values = np.asarray(func(points), dtype=float)
+        if values.shape != points.shape:
+            values = np.broadcast_to(values, points.shape).copy()
+        if not np.all(np.isfinite(values)):
+            raise ValueError("Функция принимает бесконечные или неопределённые значения на отрезке.")
+        return values
+
+    def __len__(self) -> int:
+        return self.coefficients.size
+
+    @property
+    def degree(self) -> int:
+        return self.coefficients.size - 1
+
+    def __call__(self, x_eval):
+        """
+        Вычисляет значение разложения по схеме Кленшоу для точки или массива точек.
+        :param x_eval: Точка или массив точек любой формы.
+        :return: Число для скалярного аргумента, иначе массив той же формы.
+        """
+        points = np.asarray(x_eval, dtype=float)
+        t2 = 2 * (2 * points - self.a - self.b) / (self.b - self.a)
+        b1 = np.zeros_like(points)
+        b2 = np.zeros_like(points)
+        for coefficient in self.coefficients[:0:-1]:
+            b1, b2 = t2 * b1 - b2 + coefficient, b1
+        result = t2 / 2 * b1 - b2 + self.coefficients[0]
+        return float(result) if result.ndim == 0 else result
@@ -1,4 +1,5 @@
-from graph import evaluate_lagrange, evaluate_newton, plot_polynomials
+from graph import plot_polynomials
+from interpolation import LagrangeInterpolator, NewtonInterpolator
 import matplotlib
 
 matplotlib.use('TkAgg')
@@ -43,24 +44,15 @@ def newton_polynomial(x_values, y_values):
     :param y_values: Список значений y.
     :return: Строка, представляющая полином Ньютона.
     """
-    n = len(x_values)
-
-    # Вычисление разделенных разностей
-    divided_diff: list[list[float]] = [y_values[:]]
-    for level in range(1, n):
-        diffs = []
-        for i in range(n - level):
-            diff = (divided_diff[level - 1][i + 1] - divided_diff[level - 1][i]) / (x_values[i + level] - x_values[i])
-            diffs.append(diff)
-        divided_diff.append(diffs)
+    coefficients = NewtonInterpolator(x_values, y_values).coefficients
 
     # Формирование полинома Ньютона
     terms = []
-    for level in range(n):
-        if divided_diff[level][0] == 0:  # Пропускаем нулевые коэффициенты
+    for level, coefficient in enumerate(coefficients):
+        if coefficient == 0:  # Пропускаем нулевые коэффициенты
             continue
 
-        term = [f"{divided_diff[level][0]}"]
+        term = [f"{coefficient}"]
         for i in range(level):
             term.append(f"(x - {x_values[i]})")
         terms.append(" * ".join(term))
@@ -106,6 +98,8 @@ def input_points() -> tuple[list[float], list[float]]:
 
 
 def point_input(x,y):
+    lagrange = LagrangeInterpolator(x, y)
+    newton = NewtonInterpolator(x, y)
     while True:
         try:
             # Выбор метода
@@ -122,10 +116,10 @@ def point_input(x,y):
 
             # Вычисление результата
             if method == "1":
-                y_eval = evaluate_lagrange(x, y, x_eval)
+                y_eval = lagrange(x_eval)
                 print(f"\nЗначение полинома Лагранжа в точке x = {x_eval}: y = {y_eval:.2f}")
             else:
-                y_eval = evaluate_newton(x, y, x_eval)
+                y_eval = newton(x_eval)
                 print(f"\nЗначение полинома Ньютона в точке x = {x_eval}: y = {y_eval:.2f}")
 
             plt.scatter(x_eval, y_eval, color="blue", label=f"Точка ({x_eval}, {y_eval:.2f})", linewidths=6)